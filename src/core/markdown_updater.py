@@ -11,20 +11,56 @@ from datetime import datetime
 from config import app_config as cfg
 from .metrics_calculator import calculate_performance_metrics, get_tracked_unit_progress
 
+# Dashboard patterns, compiled once at import rather than on every update
+COMPLETED_UNITS_BOLD_PATTERN = re.compile(r"\*\*Completed Units\*\*:?\s*(\d+)")
+COMPLETED_UNITS_PLAIN_PATTERN = re.compile(r"Completed Units:?\s*(\d+)")
+COMPLETED_UNITS_LOOSE_PATTERN = re.compile(r"Completed Units.*?(\d+)")
+
+# Basic stats
+TOTAL_UNITS_BOLD_PATTERN = re.compile(r"(\*\*Total Units in Course\*\*:\s*)(\d+)")
+TOTAL_UNITS_PLAIN_PATTERN = re.compile(r"(Total Units in Course:\s*)(\d+)")
+COMPLETED_UNITS_BOLD_VALUE_PATTERN = re.compile(r"(\*\*Completed Units\*\*:\s*)(\d+)")
+COMPLETED_UNITS_PLAIN_VALUE_PATTERN = re.compile(r"(Completed Units:\s*)(\d+)")
+REMAINING_UNITS_BOLD_PATTERN = re.compile(r"(\*\*Remaining Units\*\*:\s*)(\d+)")
+REMAINING_UNITS_PLAIN_PATTERN = re.compile(r"(Remaining Units:\s*)(\d+)")
+TOTAL_LESSONS_PATTERN = re.compile(r"(\*\*Total Lessons Completed\*\*:\s*)(\d+)")
+TOTAL_LESSONS_PLAIN_PATTERN = re.compile(r"(Total Lessons Completed:\s*\d+)\s*")
+CORE_PRACTICE_BREAKDOWN_PATTERN = re.compile(r"\(Core: \d+, Practice: \d+\)")
+LESSONS_REMAINING_PATTERN = re.compile(r"(Total Lessons Remaining:\s*)~?[\d,]+")
+LESSONS_PER_DAY_REQUIRED_PATTERN = re.compile(r"(Lessons Per Day Required:\s*)\*\*~?[\d.]+\*\*")
+TIME_PER_DAY_REQUIRED_PATTERN = re.compile(r"(Time Per Day Required:\s*)\*\*~?[\w\s]+\*\*")
+
+# Performance metrics
+DAILY_AVERAGE_PATTERN = re.compile(r"(\*\*Daily Average\*\*:\s*)[\d.]+\s*lessons/day.*")
+WEEKLY_AVERAGE_PATTERN = re.compile(r"(\*\*Weekly Average\*\*:\s*)[\d.]+\s*lessons/week")
+XP_DAILY_AVERAGE_PATTERN = re.compile(r"(\*\*XP Daily Average\*\*:\s*)[\d,]+\s*XP/day")
+XP_WEEKLY_AVERAGE_PATTERN = re.compile(r"(\*\*XP Weekly Average\*\*:\s*)[\d,]+\s*XP/week")
+CURRENT_STREAK_PATTERN = re.compile(r"(\*\*Current Streak\*\*:\s*)\d+\s*consecutive active days")
+RECENT_PERFORMANCE_PATTERN = re.compile(r"(\*\*Recent Performance\*\*.*?:\s*)[\d.]+\s*lessons/day,\s*[\d,]+\s*XP/day")
+
+# Goal progress
+DAILY_REQUIREMENT_PATTERN = re.compile(r"(\*\*Daily Requirement\*\*:\s*)[\d.]+\s*lessons/day.*")
+PACE_STATUS_PATTERN = re.compile(r"(\*\*Pace Status\*\*:\s*).*lessons/day")
+PROJECTED_COMPLETION_PATTERN = re.compile(r"(\*\*Projected Completion\*\*:\s*)[\d.]+\s*months.*")
+TOTAL_LESSONS_NEEDED_PATTERN = re.compile(r"(\*\*Total Lessons Needed\*\*:\s*)[\d,]+\s*lessons.*")
+GOAL_SECTION_PATTERN = re.compile(r"### 18-Month Goal Progress.*?\*This section will be updated as more units are completed\.\*\s*", re.DOTALL)
+COMPLETION_GOAL_HEADER_PATTERN = re.compile(r"(### Completion Goal: 18 Months)")
+LAST_UPDATED_PATTERN = re.compile(r"(\*Last updated:\s*)[\w\s,]+")
+
 
 
 def _validate_existing_content(content):
     """Validate and parse existing content to extract current values"""
     try:
         # More robust regex that handles markdown formatting, bullet points, etc.
-        completed_units_match = re.search(r"\*\*Completed Units\*\*:?\s*(\d+)", content)
+        completed_units_match = COMPLETED_UNITS_BOLD_PATTERN.search(content)
         if not completed_units_match:
             # Try alternative formats
-            completed_units_match = re.search(r"Completed Units:?\s*(\d+)", content)
+            completed_units_match = COMPLETED_UNITS_PLAIN_PATTERN.search(content)
         
         if not completed_units_match:
             # Last resort: just look for the number after 'Completed Units'
-            completed_units_match = re.search(r"Completed Units.*?(\d+)", content)
+            completed_units_match = COMPLETED_UNITS_LOOSE_PATTERN.search(content)
             
         if not completed_units_match:
             raise ValueError("Could not locate the 'Completed Units' pattern in the file")
@@ -49,33 +85,31 @@ def _update_basic_stats(content, progress, total_lessons_count, core_lessons, pr
     time_per_day_str = f"~{hours} hour {minutes} minutes"
 
     # Update Total Units in Course to show trackable units (not full course)
-    content = re.sub(r"(\*\*Total Units in Course\*\*:\s*)(\d+)", rf"\g<1>{cfg.TRACKABLE_TOTAL_UNITS}", content)
-    content = re.sub(r"(Total Units in Course:\s*)(\d+)", rf"\g<1>{cfg.TRACKABLE_TOTAL_UNITS}", content)
+    content = TOTAL_UNITS_BOLD_PATTERN.sub(rf"\g<1>{cfg.TRACKABLE_TOTAL_UNITS}", content)
+    content = TOTAL_UNITS_PLAIN_PATTERN.sub(rf"\g<1>{cfg.TRACKABLE_TOTAL_UNITS}", content)
     
     # Handle both "Completed Units:" and "**Completed Units**:" formats
-    content = re.sub(r"(\*\*Completed Units\*\*:\s*)(\d+)", rf"\g<1>{new_completed_units}", content)
-    content = re.sub(r"(Completed Units:\s*)(\d+)", rf"\g<1>{new_completed_units}", content)
+    content = COMPLETED_UNITS_BOLD_VALUE_PATTERN.sub(rf"\g<1>{new_completed_units}", content)
+    content = COMPLETED_UNITS_PLAIN_VALUE_PATTERN.sub(rf"\g<1>{new_completed_units}", content)
     
-    content = re.sub(r"(\*\*Remaining Units\*\*:\s*)(\d+)", rf"\g<1>{new_remaining_units}", content)
-    content = re.sub(r"(Remaining Units:\s*)(\d+)", rf"\g<1>{new_remaining_units}", content)
+    content = REMAINING_UNITS_BOLD_PATTERN.sub(rf"\g<1>{new_remaining_units}", content)
+    content = REMAINING_UNITS_PLAIN_PATTERN.sub(rf"\g<1>{new_remaining_units}", content)
     
     # Update total lessons with computed totals (handle markdown bold formatting)
-    content = re.sub(r"(\*\*Total Lessons Completed\*\*:\s*)(\d+)", rf"\g<1>{total_lessons_count}", content)
+    content = TOTAL_LESSONS_PATTERN.sub(rf"\g<1>{total_lessons_count}", content)
     
     # Add detail about core lessons vs practice (if available)
     if core_lessons is not None and practice_sessions is not None:
         # Check if we already have a breakdown line, if so update it
-        if re.search(r"\(Core: \d+, Practice: \d+\)", content):
-            content = re.sub(r"\(Core: \d+, Practice: \d+\)", 
-                          f"(Core: {core_lessons}, Practice: {practice_sessions})", content)
+        if CORE_PRACTICE_BREAKDOWN_PATTERN.search(content):
+            content = CORE_PRACTICE_BREAKDOWN_PATTERN.sub(f"(Core: {core_lessons}, Practice: {practice_sessions})", content)
         else:
             # Insert after the Total Lessons Completed line
-            content = re.sub(r"(Total Lessons Completed:\s*\d+)\s*", 
-                          f"\\1 (Core: {core_lessons}, Practice: {practice_sessions})\n", content)
+            content = TOTAL_LESSONS_PLAIN_PATTERN.sub(f"\\1 (Core: {core_lessons}, Practice: {practice_sessions})\n", content)
     
-    content = re.sub(r"(Total Lessons Remaining:\s*)~?[\d,]+", rf"\g<1>~{total_lessons_remaining:,.0f}", content)
-    content = re.sub(r"(Lessons Per Day Required:\s*)\*\*~?[\d.]+\*\*", rf"\g<1>**~{lessons_per_day_required:.1f} lessons**", content)
-    content = re.sub(r"(Time Per Day Required:\s*)\*\*~?[\w\s]+\*\*", rf"\g<1>**{time_per_day_str}**", content)
+    content = LESSONS_REMAINING_PATTERN.sub(rf"\g<1>~{total_lessons_remaining:,.0f}", content)
+    content = LESSONS_PER_DAY_REQUIRED_PATTERN.sub(rf"\g<1>**~{lessons_per_day_required:.1f} lessons**", content)
+    content = TIME_PER_DAY_REQUIRED_PATTERN.sub(rf"\g<1>**{time_per_day_str}**", content)
     
     return content
 
@@ -89,52 +123,42 @@ def _update_performance_metrics(content, json_data):
         return content
         
     # Update daily average
-    content = re.sub(r"(\*\*Daily Average\*\*:\s*)[\d.]+\s*lessons/day.*", 
-                  rf"\g<1>{metrics['daily_avg_sessions']:.1f} lessons/day (across {metrics['active_days']} active days)", content)
+    content = DAILY_AVERAGE_PATTERN.sub(rf"\g<1>{metrics['daily_avg_sessions']:.1f} lessons/day (across {metrics['active_days']} active days)", content)
     
     # Update weekly average
-    content = re.sub(r"(\*\*Weekly Average\*\*:\s*)[\d.]+\s*lessons/week", 
-                  rf"\g<1>{metrics['weekly_avg_sessions']:.1f} lessons/week", content)
+    content = WEEKLY_AVERAGE_PATTERN.sub(rf"\g<1>{metrics['weekly_avg_sessions']:.1f} lessons/week", content)
     
     # Update XP daily average
-    content = re.sub(r"(\*\*XP Daily Average\*\*:\s*)[\d,]+\s*XP/day", 
-                  rf"\g<1>{metrics['daily_avg_xp']:.0f} XP/day", content)
+    content = XP_DAILY_AVERAGE_PATTERN.sub(rf"\g<1>{metrics['daily_avg_xp']:.0f} XP/day", content)
     
     # Update XP weekly average
-    content = re.sub(r"(\*\*XP Weekly Average\*\*:\s*)[\d,]+\s*XP/week", 
-                  rf"\g<1>{metrics['weekly_avg_xp']:,.0f} XP/week", content)
+    content = XP_WEEKLY_AVERAGE_PATTERN.sub(rf"\g<1>{metrics['weekly_avg_xp']:,.0f} XP/week", content)
     
     # Update current streak
-    content = re.sub(r"(\*\*Current Streak\*\*:\s*)\d+\s*consecutive active days", 
-                  rf"\g<1>{metrics['consecutive_days']} consecutive active days", content)
+    content = CURRENT_STREAK_PATTERN.sub(rf"\g<1>{metrics['consecutive_days']} consecutive active days", content)
     
     # Update recent performance
-    content = re.sub(r"(\*\*Recent Performance\*\*.*?:\s*)[\d.]+\s*lessons/day,\s*[\d,]+\s*XP/day", 
-                  rf"\g<1>{metrics['recent_avg_sessions']:.1f} lessons/day, {metrics['recent_avg_xp']:.0f} XP/day", content)
+    content = RECENT_PERFORMANCE_PATTERN.sub(rf"\g<1>{metrics['recent_avg_sessions']:.1f} lessons/day, {metrics['recent_avg_xp']:.0f} XP/day", content)
     
     return content
 
 def _update_goal_progress_section(content, progress):
     """Update goal progress and 18-month tracking section"""
     # Update daily requirement using centralized calculation
-    content = re.sub(r"(\*\*Daily Requirement\*\*:\s*)[\d.]+\s*lessons/day.*", 
-                  rf"\g<1>{progress['required_lessons_per_day']:.1f} lessons/day (based on {progress['completed_units']} tracked units, {progress['lessons_per_unit']:.1f} avg lessons/unit)", content)
+    content = DAILY_REQUIREMENT_PATTERN.sub(rf"\g<1>{progress['required_lessons_per_day']:.1f} lessons/day (based on {progress['completed_units']} tracked units, {progress['lessons_per_unit']:.1f} avg lessons/unit)", content)
     
     # Update pace status using centralized calculation
-    content = re.sub(r"(\*\*Pace Status\*\*:\s*).*lessons/day", 
-                  rf"\g<1>{progress['pace_status']}", content)
+    content = PACE_STATUS_PATTERN.sub(rf"\g<1>{progress['pace_status']}", content)
     
     # Calculate projected completion using centralized data
     projected_days = progress['total_lessons_remaining'] / progress['current_daily_avg'] if progress['current_daily_avg'] > 0 else 0
     projected_months = projected_days / 30.44  # avg days per month
     
     # Update projected completion
-    content = re.sub(r"(\*\*Projected Completion\*\*:\s*)[\d.]+\s*months.*", 
-                  rf"\g<1>{projected_months:.1f} months ({abs(projected_months - 18):.1f} months {'early' if projected_months < 18 else 'late'})", content)
+    content = PROJECTED_COMPLETION_PATTERN.sub(rf"\g<1>{projected_months:.1f} months ({abs(projected_months - 18):.1f} months {'early' if projected_months < 18 else 'late'})", content)
     
     # Update total lessons needed using centralized calculation
-    content = re.sub(r"(\*\*Total Lessons Needed\*\*:\s*)[\d,]+\s*lessons.*", 
-                  rf"\g<1>{progress['total_lessons_remaining']:,.0f} lessons ({progress['remaining_units']} remaining units)", content)
+    content = TOTAL_LESSONS_NEEDED_PATTERN.sub(rf"\g<1>{progress['total_lessons_remaining']:,.0f} lessons ({progress['remaining_units']} remaining units)", content)
     
     # Add or update 18-month goal progress section
     goal_section = f"""
@@ -152,19 +176,17 @@ def _update_goal_progress_section(content, progress):
     # Check if 18-month goal section already exists and replace it, or add it
     if "### 18-Month Goal Progress" in content:
         # Replace existing section
-        content = re.sub(r"### 18-Month Goal Progress.*?\*This section will be updated as more units are completed\.\*\s*", 
-                      goal_section, content, flags=re.DOTALL)
+        content = GOAL_SECTION_PATTERN.sub(goal_section, content)
     else:
         # Insert before "### Completion Goal: 18 Months"
-        content = re.sub(r"(### Completion Goal: 18 Months)", 
-                      goal_section + r"\1", content)
+        content = COMPLETION_GOAL_HEADER_PATTERN.sub(goal_section + r"\1", content)
     
     return content
 
 def _finalize_and_write_content(content, newly_completed_count, total_lessons_count, core_lessons, practice_sessions):
     """Finalize content updates and write to file"""
     # Update last modified date
-    content = re.sub(r"(\*Last updated:\s*)[\w\s,]+", rf"\g<1>{datetime.now().strftime('%B %d, %Y')}", content)
+    content = LAST_UPDATED_PATTERN.sub(rf"\g<1>{datetime.now().strftime('%B %d, %Y')}", content)
 
     # Write to file
     with open(cfg.MARKDOWN_FILE, 'w') as f:
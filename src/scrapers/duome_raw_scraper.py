@@ -22,6 +22,7 @@ import json
 import requests
 from datetime import datetime
 from collections import defaultdict, Counter
+from operator import itemgetter
 from bs4 import BeautifulSoup
 import argparse
 import time
@@ -34,6 +35,18 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from config import app_config as cfg
 from utils.constants import DEFAULT_SCRAPE_DELAY, DEFAULT_REQUEST_TIMEOUT
 
+# lxml (listed in requirements.txt) tokenizes in C; much faster than 'html.parser'
+HTML_PARSER = 'lxml'
+
+# Session text always starts with the timestamp, followed by the XP token
+SESSION_HEADER_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?(\d+)XP')
+SKILL_LINK_PATTERN = re.compile(r'/skill/fr/')
+SKILL_UNIT_PATTERN = re.compile(r'/skill/fr/([^/]+)')
+UNIT_TEXT_PATTERN = re.compile(r'\d+XP([A-Za-z]+)·')
+
+# Units without reliable start points, never counted as completed
+UNRELIABLE_START_UNITS = frozenset({'On Sale'})
+
 def validate_headless_update_with_timestamps(username, wait_seconds=cfg.VALIDATION_WAIT_SECONDS):
     """
     Validate that headless button clicks work by checking timestamp changes.
@@ -493,14 +506,13 @@ def fetch_duome_data(username):
 
 def _parse_datetime_and_xp(text):
     """Extract datetime and XP from session text"""
-    datetime_match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', text)
-    xp_match = re.search(r'(\d+)XP', text)
+    header_match = SESSION_HEADER_PATTERN.match(text)
     
-    if not datetime_match or not xp_match:
+    if not header_match:
         return None, None
         
-    datetime_str = datetime_match.group(1)
-    xp = int(xp_match.group(1))
+    datetime_str, xp_str = header_match.groups()
+    xp = int(xp_str)
     dt = datetime.strptime(datetime_str, '%Y-%m-%d %H:%M:%S')
     
     return dt, xp
@@ -525,15 +537,15 @@ def _classify_session_type(text):
 def _extract_unit_name(item, text):
     """Extract unit name from session item"""
     # Try to extract from skill links first
-    skill_links = item.find_all('a', href=re.compile(r'/skill/fr/'))
+    skill_links = item.find_all('a', href=SKILL_LINK_PATTERN)
     if skill_links:
         href = skill_links[0]['href']
-        unit_match = re.search(r'/skill/fr/([^/]+)', href)
+        unit_match = SKILL_UNIT_PATTERN.search(href)
         if unit_match:
             return unit_match.group(1).replace('-', ' ')
     
     # Fallback: extract from text pattern XPUnitName
-    unit_text_match = re.search(r'\d+XP([A-Za-z]+)·', text)
+    unit_text_match = UNIT_TEXT_PATTERN.search(text)
     if unit_text_match:
         return unit_text_match.group(1)
     
@@ -541,10 +553,12 @@ def _extract_unit_name(item, text):
 
 def _create_session_object(dt, xp, session_type, unit, is_unit_completion, text):
     """Create a session object with normalized fields"""
+    # Derive date and time from one ISO string ('YYYY-MM-DDTHH:MM:SS')
+    iso_datetime = dt.isoformat()
     return {
-        'datetime': dt.isoformat(),
-        'date': dt.date().isoformat(),
-        'time': dt.time().isoformat(),
+        'datetime': iso_datetime,
+        'date': iso_datetime[:10],
+        'time': iso_datetime[11:],
         'xp': xp,
         'session_type': session_type,
         'unit': unit,
@@ -605,7 +619,7 @@ def _assign_remaining_practice_sessions(sessions):
 
 def parse_session_data(html_content):
     """Parse session data from raw HTML content"""
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, HTML_PARSER)
     session_items = soup.find_all('li')
     
     sessions = []
@@ -637,7 +651,7 @@ def parse_session_data(html_content):
         sessions.append(session)
     
     # Sort chronologically for unit assignment logic
-    sessions.sort(key=lambda x: x['datetime'])
+    sessions.sort(key=itemgetter('datetime'))
     
     # Multi-pass unit assignment
     _assign_unit_completions(sessions)
@@ -645,7 +659,7 @@ def parse_session_data(html_content):
     _assign_remaining_practice_sessions(sessions)
     
     # Sort back to newest first for output
-    sessions.sort(key=lambda x: x['datetime'], reverse=True)
+    sessions.sort(key=itemgetter('datetime'), reverse=True)
     
     return sessions, unit_transitions
 
@@ -694,55 +708,44 @@ def _filter_sessions_by_date(sessions):
     print(f"📊 Algorithm 1 constraints: Using sessions from {cfg.ANALYSIS_START_DATE} onwards")
     print(f"📊 Filtered {len(sessions)} → {len(filtered_sessions)} sessions for analysis")
     
-    return sorted(filtered_sessions, key=lambda x: x['datetime'])
-
-def _detect_unit_boundaries(sessions):
-    """Detect unit boundaries by first mention"""
-    unit_boundaries = []
-    seen_units = set()
-    
-    for session in sessions:
-        if session.get('unit') and session['unit'] not in seen_units:
-            seen_units.add(session['unit'])
-            unit_boundaries.append({
-                'unit': session['unit'],
-                'start_datetime': session['datetime']
-            })
-            print(f"📊 Unit boundary detected: {session['unit']} starts at {session['datetime']}")
-    
-    return unit_boundaries
+    return sorted(filtered_sessions, key=itemgetter('datetime'))
 
-def _assign_sessions_to_units(sessions):
-    """Assign all sessions to units based on chronological active unit"""
-    unit_session_counts = defaultdict(int)
+def _scan_unit_sessions(sessions):
+    """Detect unit boundaries by first mention and count sessions per active unit in one pass"""
+    start_datetimes = {}
+    unit_session_counts = Counter()
     current_unit = None
     
     for session in sessions:
         # Update current unit if this session has an explicit unit
         if session.get('unit'):
             current_unit = session['unit']
+            if current_unit not in start_datetimes:
+                start_datetimes[current_unit] = session['datetime']
+                print(f"📊 Unit boundary detected: {current_unit} starts at {session['datetime']}")
         
         # Assign unit to session object and count it
         if current_unit:
             session['assigned_unit'] = current_unit
             unit_session_counts[current_unit] += 1
     
-    return unit_session_counts
+    unit_boundaries = [
+        {'unit': unit, 'start_datetime': start_datetime}
+        for unit, start_datetime in start_datetimes.items()
+    ]
+    return unit_boundaries, unit_session_counts
 
 def _filter_completed_units(unit_session_counts, unit_boundaries):
     """Exclude incomplete units"""
-    unit_sequence = [b['unit'] for b in unit_boundaries]
-    EXCLUDED_UNITS = {'On Sale'}  # Units without reliable start points
-    
-    if unit_sequence:
-        current_unit_name = unit_sequence[-1]
-        excluded_units = EXCLUDED_UNITS | {current_unit_name}
-        print(f"📊 Excluding incomplete units: {excluded_units}")
-        return {unit: count for unit, count in unit_session_counts.items() 
-                if unit not in excluded_units}
-    else:
-        return {unit: count for unit, count in unit_session_counts.items() 
-                if unit not in EXCLUDED_UNITS}
+    excluded_units = UNRELIABLE_START_UNITS
+    
+    if unit_boundaries:
+        current_unit_name = unit_boundaries[-1]['unit']
+        excluded_units = excluded_units | {current_unit_name}
+        print(f"📊 Excluding incomplete units: {set(excluded_units)}")
+    
+    return {unit: count for unit, count in unit_session_counts.items() 
+            if unit not in excluded_units}
 
 def _apply_subunit_folding(completed_units, unit_boundaries):
     """Apply sub-unit folding for small units"""
@@ -827,15 +830,12 @@ def calculate_recent_lessons_per_unit(sessions):
     # Step 1: Filter and sort sessions
     sorted_sessions = _filter_sessions_by_date(sessions)
     
-    # Step 2: Detect unit boundaries
-    unit_boundaries = _detect_unit_boundaries(sorted_sessions)
+    # Steps 2-3: Detect unit boundaries and assign sessions to units
+    unit_boundaries, unit_session_counts = _scan_unit_sessions(sorted_sessions)
     if len(unit_boundaries) < 2:
         print(f"⚠️ Need at least 2 units for analysis, found {len(unit_boundaries)}")
         return None
     
-    # Step 3: Assign sessions to units
-    unit_session_counts = _assign_sessions_to_units(sorted_sessions)
-    
     # Step 4: Filter completed units
     completed_units = _filter_completed_units(unit_session_counts, unit_boundaries)
     
@@ -928,7 +928,7 @@ def scrape_duome(username, use_automation=True, headless=True):
     if not html_content:
         return None
 
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, HTML_PARSER)
     
     # =================================================================
     # CRITICAL DATA SOURCE WARNING:
@@ -0,0 +1,25 @@
+"""Console output helpers for the Duolingo tracker's diagnostic scripts."""
+from __future__ import annotations
+
+import io
+import sys
+from contextlib import contextmanager, redirect_stdout
+from typing import Callable, Iterator
+
+
+@contextmanager
+def buffered_output() -> Iterator[Callable[..., None]]:
+    """Buffer everything printed in the block and write it to stdout in one call.
+    
+    Output from callees is captured too, so it stays in order with the block's
+    own lines. The buffer is written even if the block raises.
+    
+    Yields:
+        print, for writing report lines into the buffer
+    """
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield print
+    finally:
+        sys.stdout.write(buffer.getvalue())
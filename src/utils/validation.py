@@ -59,20 +59,23 @@ def validate_data_directory(create_if_missing: bool = True) -> bool:
     """
     data_dir = cfg.DATA_DIR
     
-    if os.path.exists(data_dir):
-        return True
-    
     if create_if_missing:
+        # Let mkdir report an existing directory instead of probing first
         try:
-            os.makedirs(data_dir, exist_ok=True)
-            print(f"✅ Created data directory: {data_dir}")
+            os.makedirs(data_dir)
+        except FileExistsError:
             return True
         except OSError as e:
             print(f"❌ Failed to create data directory {data_dir}: {e}")
             return False
-    else:
-        print(f"❌ Data directory not found: {data_dir}")
-        return False
+        print(f"✅ Created data directory: {data_dir}")
+        return True
+    
+    if os.path.exists(data_dir):
+        return True
+    
+    print(f"❌ Data directory not found: {data_dir}")
+    return False
 
 
 def validate_required_files(files: List[str], create_missing: bool = False) -> bool:
@@ -98,7 +101,7 @@ def validate_required_files(files: List[str], create_missing: bool = False) -> b
             try:
                 # Create parent directory if needed
                 parent_dir = os.path.dirname(filepath)
-                if parent_dir and not os.path.exists(parent_dir):
+                if parent_dir:
                     os.makedirs(parent_dir, exist_ok=True)
                 
                 # Create empty file
@@ -116,6 +119,16 @@ def validate_required_files(files: List[str], create_missing: bool = False) -> b
     return all_exist
 
 
+# Project component checks in the order they are reported; each is read at call time
+PROJECT_CHECKS = (
+    ('venv_python', lambda: validate_venv_python(print_error=False)),
+    ('data_directory', lambda: validate_data_directory(create_if_missing=False)),
+    ('state_file', lambda: os.path.exists(cfg.STATE_FILE)),
+    ('markdown_file', lambda: os.path.exists(cfg.MARKDOWN_FILE)),
+    ('notifier_config', lambda: os.path.exists(cfg.NOTIFIER_CONFIG_FILE)),
+)
+
+
 def get_project_status() -> dict:
     """
     Get overall project validation status.
@@ -123,14 +136,21 @@ def get_project_status() -> dict:
     Returns:
         dict: Status of various project components
     """
-    status = {
-        'venv_python': validate_venv_python(print_error=False),
-        'data_directory': validate_data_directory(create_if_missing=False),
-        'state_file': os.path.exists(cfg.STATE_FILE),
-        'markdown_file': os.path.exists(cfg.MARKDOWN_FILE),
-        'notifier_config': os.path.exists(cfg.NOTIFIER_CONFIG_FILE)
-    }
+    status = {name: check() for name, check in PROJECT_CHECKS}
     
     status['all_valid'] = all(status.values())
     
-    return status
\ No newline at end of file
+    return status
+
+
+def is_project_valid() -> bool:
+    """
+    Check whether all project components are present, stopping at the first failure.
+    
+    Use this as a gate; use get_project_status() when per-component
+    diagnostics are needed.
+    
+    Returns:
+        bool: True if every component in PROJECT_CHECKS is valid
+    """
+    return all(check() for _, check in PROJECT_CHECKS)
@@ -5,7 +5,13 @@ Test notification output accuracy after dual-mode tracking updates.
 
 import sys
 import os
-import json
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
 
 # Setup project paths
 current_dir = os.path.dirname(__file__)
@@ -15,177 +21,183 @@ sys.path.insert(0, os.path.abspath(current_dir))
 from config import app_config as cfg
 from src.core.metrics_calculator import get_tracked_unit_progress, calculate_performance_metrics
 from src.notifiers.pushover_notifier import PushoverNotifier
+from src.utils.output import buffered_output
 
 def test_performance_metrics():
     """Test the updated performance metrics calculation."""
-    print("=== TESTING PERFORMANCE METRICS ===\n")
-    
-    # Load actual session data
-    data_dir = os.path.join(current_dir, 'data')
-    target_file = 'duome_raw_jonamar_20250724_123025.json'
-    file_path = os.path.join(data_dir, target_file)
-    
-    if not os.path.exists(file_path):
-        print(f"❌ Test data file not found: {target_file}")
-        return None
-    
-    with open(file_path, 'r') as f:
-        json_data = json.load(f)
-    
-    metrics = calculate_performance_metrics(json_data)
-    
-    if not metrics:
-        print("❌ No performance metrics calculated!")
-        return None
-    
-    print("Performance metrics results:")
-    print(f"- Total sessions: {len(json_data.get('sessions', []))}")
-    print(f"- Daily avg lessons: {metrics['daily_avg_lessons']:.2f}")
-    print(f"- Daily avg sessions: {metrics['daily_avg_sessions']:.2f}")
-    print(f"- Weekly avg lessons: {metrics['weekly_avg_lessons']:.2f}")
-    print(f"- Recent avg lessons (7-day): {metrics['recent_avg_lessons']:.2f}")
-    print(f"- Recent avg sessions (7-day): {metrics['recent_avg_sessions']:.2f}")
-    print(f"- Active days: {metrics['active_days']}")
-    print(f"- Recent days: {metrics['recent_days']}")
-    
-    print(f"\n🎯 Expected vs Actual:")
-    print(f"- Our manual analysis: 11.6 lessons/day (last 7 days)")
-    print(f"- System calculation: {metrics['recent_avg_lessons']:.1f} lessons/day")
-    
-    close_match = abs(metrics['recent_avg_lessons'] - 11.6) < 1.0
-    print(f"- Match: {'✅ CLOSE' if close_match else '❌ MISMATCH'}")
-    
-    return metrics
+    with buffered_output() as log:
+        log("=== TESTING PERFORMANCE METRICS ===\n")
+        
+        # Load actual session data
+        data_dir = os.path.join(current_dir, 'data')
+        target_file = 'duome_raw_jonamar_20250724_123025.json'
+        file_path = os.path.join(data_dir, target_file)
+        
+        if not os.path.exists(file_path):
+            log(f"❌ Test data file not found: {target_file}")
+            return None
+        
+        with open(file_path, 'rb') as f:
+            json_data = _json_loads(f.read())
+        
+        metrics = calculate_performance_metrics(json_data)
+        
+        if not metrics:
+            log("❌ No performance metrics calculated!")
+            return None
+        
+        log("Performance metrics results:")
+        log(f"- Total sessions: {len(json_data.get('sessions', []))}")
+        log(f"- Daily avg lessons: {metrics['daily_avg_lessons']:.2f}")
+        log(f"- Daily avg sessions: {metrics['daily_avg_sessions']:.2f}")
+        log(f"- Weekly avg lessons: {metrics['weekly_avg_lessons']:.2f}")
+        log(f"- Recent avg lessons (7-day): {metrics['recent_avg_lessons']:.2f}")
+        log(f"- Recent avg sessions (7-day): {metrics['recent_avg_sessions']:.2f}")
+        log(f"- Active days: {metrics['active_days']}")
+        log(f"- Recent days: {metrics['recent_days']}")
+        
+        log(f"\n🎯 Expected vs Actual:")
+        log(f"- Our manual analysis: 11.6 lessons/day (last 7 days)")
+        log(f"- System calculation: {metrics['recent_avg_lessons']:.1f} lessons/day")
+        
+        close_match = abs(metrics['recent_avg_lessons'] - 11.6) < 1.0
+        log(f"- Match: {'✅ CLOSE' if close_match else '❌ MISMATCH'}")
+        
+        return metrics
 
 def test_dual_mode_progress():
     """Test dual-mode progress calculations."""
-    print("\n=== TESTING DUAL-MODE PROGRESS ===\n")
-    
-    # Current state
-    current_state = {
-        'total_lessons_completed': 134,
-        'daily_lessons_completed': 14,
-        'daily_goal_lessons': 12,
-    }
-    
-    progress = get_tracked_unit_progress(current_state)
-    
-    print("Dual-mode progress results:")
-    print(f"- Total lessons: {progress['total_lessons']}")
-    print(f"- Completed units: {progress['completed_units']:.2f}")
-    print(f"- Required lessons/day: {progress['required_lessons_per_day']:.1f}")
-    print(f"- Course completion: {progress['course_completion_percentage']:.1f}%")
-    print(f"- Time completion: {progress['time_completion_percentage']:.1f}%")
-    
-    # Verify course completion calculation
-    expected_course_pct = (134 / (964 * 7)) * 100  # 964 units * 7 lessons = 6748 total
-    actual_course_pct = progress['course_completion_percentage']
-    
-    print(f"\n📊 Course completion verification:")
-    print(f"- Expected: {expected_course_pct:.2f}%")
-    print(f"- Actual: {actual_course_pct:.2f}%")
-    print(f"- Match: {'✅ CORRECT' if abs(expected_course_pct - actual_course_pct) < 0.1 else '❌ INCORRECT'}")
-    
-    return progress
+    with buffered_output() as log:
+        log("\n=== TESTING DUAL-MODE PROGRESS ===\n")
+        
+        # Current state
+        current_state = {
+            'total_lessons_completed': 134,
+            'daily_lessons_completed': 14,
+            'daily_goal_lessons': 12,
+        }
+        
+        progress = get_tracked_unit_progress(current_state)
+        
+        log("Dual-mode progress results:")
+        log(f"- Total lessons: {progress['total_lessons']}")
+        log(f"- Completed units: {progress['completed_units']:.2f}")
+        log(f"- Required lessons/day: {progress['required_lessons_per_day']:.1f}")
+        log(f"- Course completion: {progress['course_completion_percentage']:.1f}%")
+        log(f"- Time completion: {progress['time_completion_percentage']:.1f}%")
+        
+        # Verify course completion calculation
+        expected_course_pct = (134 / (964 * 7)) * 100  # 964 units * 7 lessons = 6748 total
+        actual_course_pct = progress['course_completion_percentage']
+        
+        log(f"\n📊 Course completion verification:")
+        log(f"- Expected: {expected_course_pct:.2f}%")
+        log(f"- Actual: {actual_course_pct:.2f}%")
+        log(f"- Match: {'✅ CORRECT' if abs(expected_course_pct - actual_course_pct) < 0.1 else '❌ INCORRECT'}")
+        
+        return progress
 
 def test_notification_format():
     """Test the notification message formatting."""
-    print("\n=== TESTING NOTIFICATION FORMAT ===\n")
-    
-    # Load test data
-    data_dir = os.path.join(current_dir, 'data')
-    target_file = 'duome_raw_jonamar_20250724_123025.json'
-    file_path = os.path.join(data_dir, target_file)
-    
-    if not os.path.exists(file_path):
-        print(f"❌ Test data file not found: {target_file}")
-        return False
-    
-    with open(file_path, 'r') as f:
-        json_data = json.load(f)
-    
-    # Current state and daily progress
-    current_state = {
-        'total_lessons_completed': 134,
-        'daily_lessons_completed': 14,
-        'daily_goal_lessons': 12,
-    }
-    
-    daily_progress = {
-        'completed': 14,
-        'goal': 12,
-        'progress_pct': 116.7
-    }
-    
-    # Create notifier and format message
-    notifier = PushoverNotifier()
-    message = notifier._format_notification_message(daily_progress, current_state, json_data)
-    
-    print("Generated notification message:")
-    print("─" * 40)
-    print(message)
-    print("─" * 40)
-    
-    # Verify message components
-    lines = message.split('\n')
-    if len(lines) != 3:
-        print(f"❌ Expected 3 lines, got {len(lines)}")
-        return False
-    
-    # Check line 1: daily progress
-    line1_has_lessons = "lessons" in lines[0].lower()
-    line1_has_daily_pct = "daily" in lines[0].lower()
-    
-    # Check line 2: course percentage and weekly average
-    line2_has_course = "course:" in lines[1].lower()
-    line2_has_week_avg = "week avg:" in lines[1].lower()
-    
-    # Check line 3: finish date
-    line3_has_finish = "finish:" in lines[2].lower()
-    
-    print(f"\nMessage validation:")
-    print(f"- Line 1 has lessons: {'✅' if line1_has_lessons else '❌'}")
-    print(f"- Line 1 has daily %: {'✅' if line1_has_daily_pct else '❌'}")
-    print(f"- Line 2 has course %: {'✅' if line2_has_course else '❌'}")
-    print(f"- Line 2 has week avg: {'✅' if line2_has_week_avg else '❌'}")
-    print(f"- Line 3 has finish: {'✅' if line3_has_finish else '❌'}")
-    
-    all_valid = all([line1_has_lessons, line1_has_daily_pct, line2_has_course, 
-                     line2_has_week_avg, line3_has_finish])
-    
-    print(f"- Overall format: {'✅ VALID' if all_valid else '❌ INVALID'}")
-    
-    return all_valid
+    with buffered_output() as log:
+        log("\n=== TESTING NOTIFICATION FORMAT ===\n")
+        
+        # Load test data
+        data_dir = os.path.join(current_dir, 'data')
+        target_file = 'duome_raw_jonamar_20250724_123025.json'
+        file_path = os.path.join(data_dir, target_file)
+        
+        if not os.path.exists(file_path):
+            log(f"❌ Test data file not found: {target_file}")
+            return False
+        
+        with open(file_path, 'rb') as f:
+            json_data = _json_loads(f.read())
+        
+        # Current state and daily progress
+        current_state = {
+            'total_lessons_completed': 134,
+            'daily_lessons_completed': 14,
+            'daily_goal_lessons': 12,
+        }
+        
+        daily_progress = {
+            'completed': 14,
+            'goal': 12,
+            'progress_pct': 116.7
+        }
+        
+        # Create notifier and format message
+        notifier = PushoverNotifier()
+        message = notifier._format_notification_message(daily_progress, current_state, json_data)
+        
+        log("Generated notification message:")
+        log("─" * 40)
+        log(message)
+        log("─" * 40)
+        
+        # Verify message components
+        lines = message.split('\n')
+        if len(lines) != 3:
+            log(f"❌ Expected 3 lines, got {len(lines)}")
+            return False
+        
+        # Check line 1: daily progress
+        line1_has_lessons = "lessons" in lines[0].lower()
+        line1_has_daily_pct = "daily" in lines[0].lower()
+        
+        # Check line 2: course percentage and weekly average
+        line2_has_course = "course:" in lines[1].lower()
+        line2_has_week_avg = "week avg:" in lines[1].lower()
+        
+        # Check line 3: finish date
+        line3_has_finish = "finish:" in lines[2].lower()
+        
+        log(f"\nMessage validation:")
+        log(f"- Line 1 has lessons: {'✅' if line1_has_lessons else '❌'}")
+        log(f"- Line 1 has daily %: {'✅' if line1_has_daily_pct else '❌'}")
+        log(f"- Line 2 has course %: {'✅' if line2_has_course else '❌'}")
+        log(f"- Line 2 has week avg: {'✅' if line2_has_week_avg else '❌'}")
+        log(f"- Line 3 has finish: {'✅' if line3_has_finish else '❌'}")
+        
+        all_valid = all([line1_has_lessons, line1_has_daily_pct, line2_has_course, 
+                         line2_has_week_avg, line3_has_finish])
+        
+        log(f"- Overall format: {'✅ VALID' if all_valid else '❌ INVALID'}")
+        
+        return all_valid
 
 def main():
     """Run all notification tests."""
-    print("🧪 TESTING NOTIFICATION OUTPUT AFTER DUAL-MODE UPDATES\n")
+    with buffered_output() as log:
+        log("🧪 TESTING NOTIFICATION OUTPUT AFTER DUAL-MODE UPDATES\n")
     
     # Run all tests
     metrics_result = test_performance_metrics()
     progress_result = test_dual_mode_progress()
     format_result = test_notification_format()
     
-    # Summary
-    print(f"\n📋 TEST SUMMARY:")
-    metrics_ok = metrics_result is not None
-    progress_ok = progress_result is not None
-    
-    print(f"- Performance metrics: {'✅ PASS' if metrics_ok else '❌ FAIL'}")
-    print(f"- Dual-mode progress: {'✅ PASS' if progress_ok else '❌ FAIL'}")
-    print(f"- Notification format: {'✅ PASS' if format_result else '❌ FAIL'}")
-    
-    all_tests_passed = metrics_ok and progress_ok and format_result
-    
-    if all_tests_passed:
-        print(f"\n🎉 ALL TESTS PASSED! Notification system ready.")
-        print(f"\nKey improvements verified:")
-        print(f"- Weekly average now counts lessons (not sessions)")
-        print(f"- Course completion percentage included")
-        print(f"- Dual-mode tracking integration working")
-        print(f"- Message format updated correctly")
-    else:
-        print(f"\n❌ Some tests failed. Please review the issues above.")
+    with buffered_output() as log:
+        # Summary
+        log(f"\n📋 TEST SUMMARY:")
+        metrics_ok = metrics_result is not None
+        progress_ok = progress_result is not None
+        
+        log(f"- Performance metrics: {'✅ PASS' if metrics_ok else '❌ FAIL'}")
+        log(f"- Dual-mode progress: {'✅ PASS' if progress_ok else '❌ FAIL'}")
+        log(f"- Notification format: {'✅ PASS' if format_result else '❌ FAIL'}")
+        
+        all_tests_passed = metrics_ok and progress_ok and format_result
+        
+        if all_tests_passed:
+            log(f"\n🎉 ALL TESTS PASSED! Notification system ready.")
+            log(f"\nKey improvements verified:")
+            log(f"- Weekly average now counts lessons (not sessions)")
+            log(f"- Course completion percentage included")
+            log(f"- Dual-mode tracking integration working")
+            log(f"- Message format updated correctly")
+        else:
+            log(f"\n❌ Some tests failed. Please review the issues above.")
     
     return all_tests_passed
 
@@ -5,94 +5,127 @@ Pytest configuration and fixtures for Owlgorithm tests
 import pytest
 import os
 import sys
+import copy
 import json
+import functools
 from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
 
-# Add src to path for importing modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+try:
+    from pytest_socket import disable_socket
+except ImportError:  # optional: pip install pytest-socket
+    disable_socket = None
 
+try:
+    from orjson import loads as _fixture_json_loads
+except ImportError:  # optional: pip install orjson
+    _fixture_json_loads = json.loads
 
-@pytest.fixture
-def sample_session_data():
-    """Sample session data for testing"""
-    return {
-        'sessions': [
-            {
-                'datetime': '2025-06-28T10:30:00',
-                'date': '2025-06-28',
-                'time': '10:30:00',
-                'xp': 15,
-                'session_type': 'unit_lesson',
-                'unit': 'Requests',
-                'is_lesson': True,
-                'is_unit_completion': False,
-                'raw_text': 'sample lesson'
-            },
-            {
-                'datetime': '2025-06-28T11:00:00',
-                'date': '2025-06-28',
-                'time': '11:00:00',
-                'xp': 10,
-                'session_type': 'personalized_practice',
-                'unit': 'Requests',
-                'is_lesson': False,
-                'is_unit_completion': False,
-                'raw_text': 'sample practice'
-            },
-            {
-                'datetime': '2025-06-27T15:30:00',
-                'date': '2025-06-27',
-                'time': '15:30:00',
-                'xp': 20,
-                'session_type': 'unit_completion',
-                'unit': 'Grooming',
-                'is_lesson': True,
-                'is_unit_completion': True,
-                'raw_text': 'unit completion'
-            }
-        ],
-        'unit_stats': {
-            'Grooming': {
-                'total_combined_lessons': 25,
-                'total_lessons': 12,
-                'total_practice': 13,
-                'session_types': {'unit_completion': 1, 'unit_lesson': 12, 'personalized_practice': 13}
-            },
-            'Requests': {
-                'total_combined_lessons': 15,
-                'total_lessons': 8,
-                'total_practice': 7,
-                'session_types': {'unit_lesson': 8, 'personalized_practice': 7}
-            }
+# Add project root and src to path once for every test module
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+for import_path in (str(PROJECT_ROOT / 'src'), str(PROJECT_ROOT)):
+    if import_path not in sys.path:
+        sys.path.insert(0, import_path)
+
+
+def pytest_configure(config):
+    """Register custom markers"""
+    config.addinivalue_line(
+        "markers", "benchmark: opt-in performance benchmarks (requires pytest-benchmark)"
+    )
+    config.addinivalue_line(
+        "markers", "slow: end-to-end smoke checks that exercise the full stack (deselect with -m 'not slow')"
+    )
+
+
+def pytest_runtest_setup(item):
+    """Fail fast on accidental real network access when pytest-socket is installed"""
+    if disable_socket is not None and item.get_closest_marker('enable_socket') is None:
+        disable_socket(allow_unix_socket=True)
+
+
+FIXTURES_DIR = PROJECT_ROOT / 'tests' / 'fixtures'
+
+
+@functools.lru_cache(maxsize=None)
+def load_fixture_json(name):
+    """Parse a JSON file from tests/fixtures, reading it from disk only once (with orjson if installed)"""
+    return _fixture_json_loads((FIXTURES_DIR / name).read_bytes())
+
+
+# Shared sample data is built once at import and exposed read-only
+SAMPLE_SESSION_DATA = MappingProxyType({
+    'sessions': [
+        {
+            'datetime': '2025-06-28T10:30:00',
+            'date': '2025-06-28',
+            'time': '10:30:00',
+            'xp': 15,
+            'session_type': 'unit_lesson',
+            'unit': 'Requests',
+            'is_lesson': True,
+            'is_unit_completion': False,
+            'raw_text': 'sample lesson'
+        },
+        {
+            'datetime': '2025-06-28T11:00:00',
+            'date': '2025-06-28',
+            'time': '11:00:00',
+            'xp': 10,
+            'session_type': 'personalized_practice',
+            'unit': 'Requests',
+            'is_lesson': False,
+            'is_unit_completion': False,
+            'raw_text': 'sample practice'
+        },
+        {
+            'datetime': '2025-06-27T15:30:00',
+            'date': '2025-06-27',
+            'time': '15:30:00',
+            'xp': 20,
+            'session_type': 'unit_completion',
+            'unit': 'Grooming',
+            'is_lesson': True,
+            'is_unit_completion': True,
+            'raw_text': 'unit completion'
+        }
+    ],
+    'unit_stats': {
+        'Grooming': {
+            'total_combined_lessons': 25,
+            'total_lessons': 12,
+            'total_practice': 13,
+            'session_types': {'unit_completion': 1, 'unit_lesson': 12, 'personalized_practice': 13}
         },
-        'computed_total_sessions': 3,
-        'computed_lesson_count': 2,
-        'computed_practice_count': 1
-    }
+        'Requests': {
+            'total_combined_lessons': 15,
+            'total_lessons': 8,
+            'total_practice': 7,
+            'session_types': {'unit_lesson': 8, 'personalized_practice': 7}
+        }
+    },
+    'computed_total_sessions': 3,
+    'computed_lesson_count': 2,
+    'computed_practice_count': 1
+})
 
 
-@pytest.fixture
-def sample_state_data():
-    """Sample state data for testing"""
-    return {
-        'processed_units': ['Nightmare', 'Grooming'],
-        'total_completed_units': 86,
-        'total_lessons_completed': 163,
-        'computed_total_sessions': 163,
-        'computed_lesson_count': 49,
-        'computed_practice_count': 114,
-        'daily_lessons_completed': 9,
-        'daily_goal_lessons': 15,
-        'last_daily_reset': '2025-06-28',
-        'last_scrape_date': '2025-06-28'
-    }
+SAMPLE_STATE_DATA = MappingProxyType({
+    'processed_units': ['Nightmare', 'Grooming'],
+    'total_completed_units': 86,
+    'total_lessons_completed': 163,
+    'computed_total_sessions': 163,
+    'computed_lesson_count': 49,
+    'computed_practice_count': 114,
+    'daily_lessons_completed': 9,
+    'daily_goal_lessons': 15,
+    'last_daily_reset': '2025-06-28',
+    'last_scrape_date': '2025-06-28'
+})
 
 
-@pytest.fixture
-def sample_markdown_content():
-    """Sample markdown content for testing"""
-    return """# Duolingo Learning Analytics
+SAMPLE_MARKDOWN_CONTENT = """# Duolingo Learning Analytics
 
 ## French Course Progression
 
@@ -116,4 +149,62 @@ def sample_markdown_content():
 - **Total Lessons Needed**: 4,836 lessons (186 remaining units)
 
 *Last updated: June 28, 2025*
-"""
\ No newline at end of file
+"""
+
+
+@pytest.fixture(scope="session")
+def app_cfg():
+    """Loaded application config module, imported once per test session"""
+    from config import app_config
+    return app_config
+
+
+@pytest.fixture(scope="session")
+def malformed_soup():
+    """Truncated, non-duome HTML parsed once per test session"""
+    from bs4 import BeautifulSoup
+    
+    malformed_html = "<html><body>Incomplete HTML without proper duome.eu structure"
+    return BeautifulSoup(malformed_html, 'lxml')
+
+
+@pytest.fixture(scope="session")
+def fixture_scrape_data():
+    """Realistic scrape data from tests/fixtures (shared, treat as read-only)"""
+    return load_fixture_json('sample_scrape_data.json')
+
+
+@pytest.fixture(scope="session")
+def fixture_state_data():
+    """Realistic state data from tests/fixtures (shared, treat as read-only)"""
+    return load_fixture_json('sample_state_data.json')
+
+
+@pytest.fixture(scope="session")
+def sample_session_data():
+    """Sample session data for testing (shared, read-only)"""
+    return SAMPLE_SESSION_DATA
+
+
+@pytest.fixture
+def mutable_session_data():
+    """Private, modifiable copy of the sample session data"""
+    return copy.deepcopy(dict(SAMPLE_SESSION_DATA))
+
+
+@pytest.fixture(scope="session")
+def sample_state_data():
+    """Sample state data for testing (shared, read-only)"""
+    return SAMPLE_STATE_DATA
+
+
+@pytest.fixture
+def mutable_state_data():
+    """Private, modifiable copy of the sample state data"""
+    return copy.deepcopy(dict(SAMPLE_STATE_DATA))
+
+
+@pytest.fixture(scope="session")
+def sample_markdown_content():
+    """Sample markdown content for testing"""
+    return SAMPLE_MARKDOWN_CONTENT
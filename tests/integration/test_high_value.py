@@ -8,30 +8,120 @@ future development but aren't covered by the essential smoke tests.
 
 Purpose: Prevent common failure modes that impact development velocity
 Coverage: Configuration loading, state corruption recovery, browser fallback, edge cases
+
+Tests here must stay safe to run in parallel (pytest -n auto): write files only
+under tmp_path and never mutate module-level data.
 """
 
+import importlib.util
 import json
-import os
-import sys
-import tempfile
-import time
-from pathlib import Path
-from unittest.mock import patch, MagicMock
 
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from src.core.metrics_calculator import calculate_daily_progress, calculate_performance_metrics, count_todays_lessons
-from src.core import daily_tracker
+class TimeoutException(Exception):
+    """Stand-in for selenium's TimeoutException, which the retry handler classifies by class name"""
+
+
+# Unusual scrape payloads that lesson counting must survive without crashing
+EDGE_CASES = [
+    ("empty_sessions", {
+        "username": "testuser",
+        "sessions": [],
+        "computed_lesson_count": 0,
+        "computed_practice_count": 0,
+        "total_sessions": 0
+    }),
+    ("future_dates", {
+        "username": "testuser",
+        "sessions": [
+            {
+                "datetime": "2030-01-01T12:00:00",  # Future date
+                "date": "2030-01-01",
+                "xp": 50,
+                "session_type": "lesson",
+                "is_lesson": True
+            }
+        ],
+        "computed_lesson_count": 1,
+        "total_sessions": 1
+    }),
+    ("weird_xp", {
+        "username": "testuser", 
+        "sessions": [
+            {
+                "datetime": "2025-07-06T12:00:00",
+                "date": "2025-07-06",
+                "xp": 0,  # Zero XP
+                "session_type": "lesson",
+                "is_lesson": True
+            },
+            {
+                "datetime": "2025-07-06T13:00:00", 
+                "date": "2025-07-06",
+                "xp": -10,  # Negative XP (shouldn't happen but test anyway)
+                "session_type": "practice",
+                "is_lesson": True
+            }
+        ],
+        "computed_lesson_count": 2,
+        "total_sessions": 2
+    }),
+    ("malformed_sessions", {
+        "username": "testuser",
+        "sessions": [
+            {
+                "datetime": "2025-07-06T12:00:00",
+                "date": "2025-07-06",
+                "xp": 50,
+                # Missing session_type
+                "unit": None,  # Null unit
+                "is_lesson": True
+            },
+            {
+                "datetime": "2025-07-06T13:00:00",
+                "date": "2025-07-06",
+                # Missing xp field
+                "session_type": "lesson",
+                "unit": "",  # Empty unit name
+                "is_lesson": True
+            },
+            {
+                # Missing required fields
+                "xp": 30
+            }
+        ],
+        "computed_lesson_count": 3,
+        "total_sessions": 3
+    }),
+    ("extreme_dates", {
+        "username": "testuser",
+        "sessions": [
+            {
+                "datetime": "1900-01-01T00:00:00",  # Very old date
+                "date": "1900-01-01", 
+                "xp": 10,
+                "session_type": "lesson",
+                "is_lesson": True
+            },
+            {
+                "datetime": "2100-12-31T23:59:59",  # Far future date
+                "date": "2100-12-31",
+                "xp": 20, 
+                "session_type": "practice",
+                "is_lesson": True
+            }
+        ],
+        "computed_lesson_count": 2,
+        "total_sessions": 2
+    }),
+]
 
 
 class TestHighValueFutureDevelopment:
     """High-value tests that prevent common failure modes in future development"""
     
-    def test_configuration_loading_and_validation(self):
+    def test_configuration_loading_and_validation(self, app_cfg):
         """
         Test 1: Configuration Loading & Validation
         
@@ -40,25 +130,8 @@ class TestHighValueFutureDevelopment:
         - Validates required configuration fields exist
         - Checks data types are correct
         - Tests graceful handling of missing config
-        
-        Target: < 5 seconds execution time
         """
-        start_time = time.time()
-        
-        # Test 1: Core configuration loading
-        try:
-            from config import app_config as cfg
-            config_loads = True
-        except ImportError as e:
-            config_loads = False
-            pytest.fail(f"Configuration import failed: {e}")
-        except Exception as e:
-            config_loads = False
-            pytest.fail(f"Configuration loading failed with unexpected error: {e}")
-        
-        assert config_loads, "app_config.py should load without errors"
-        
-        # Test 2: Required configuration fields exist
+        # Test 1: Required configuration fields exist
         required_fields = [
             'USERNAME',
             'DAILY_GOAL_LESSONS', 
@@ -67,33 +140,27 @@ class TestHighValueFutureDevelopment:
         
         missing_fields = []
         for field in required_fields:
-            if not hasattr(cfg, field):
+            if not hasattr(app_cfg, field):
                 missing_fields.append(field)
         
         assert len(missing_fields) == 0, f"Missing required config fields: {missing_fields}"
         
-        # Test 3: Configuration data types are correct
-        assert isinstance(cfg.USERNAME, str), "USERNAME should be string"
-        assert isinstance(cfg.DAILY_GOAL_LESSONS, int), "DAILY_GOAL_LESSONS should be integer"
-        assert isinstance(cfg.TOTAL_COURSE_UNITS, int), "TOTAL_COURSE_UNITS should be integer"
+        # Test 2: Configuration data types are correct
+        assert isinstance(app_cfg.USERNAME, str), "USERNAME should be string"
+        assert isinstance(app_cfg.DAILY_GOAL_LESSONS, int), "DAILY_GOAL_LESSONS should be integer"
+        assert isinstance(app_cfg.TOTAL_COURSE_UNITS, int), "TOTAL_COURSE_UNITS should be integer"
         
-        # Test 4: Configuration values are reasonable
-        assert len(cfg.USERNAME) > 0, "USERNAME should not be empty"
-        assert 1 <= cfg.DAILY_GOAL_LESSONS <= 100, f"DAILY_GOAL_LESSONS should be reasonable: {cfg.DAILY_GOAL_LESSONS}"
-        assert 1 <= cfg.TOTAL_COURSE_UNITS <= 1000, f"TOTAL_COURSE_UNITS should be reasonable: {cfg.TOTAL_COURSE_UNITS}"
+        # Test 3: Configuration values are reasonable
+        assert len(app_cfg.USERNAME) > 0, "USERNAME should not be empty"
+        assert 1 <= app_cfg.DAILY_GOAL_LESSONS <= 100, f"DAILY_GOAL_LESSONS should be reasonable: {app_cfg.DAILY_GOAL_LESSONS}"
+        assert 1 <= app_cfg.TOTAL_COURSE_UNITS <= 1000, f"TOTAL_COURSE_UNITS should be reasonable: {app_cfg.TOTAL_COURSE_UNITS}"
         
-        # Test 5: Optional fields have defaults if present
-        if hasattr(cfg, 'TIMEOUT_SECONDS'):
-            assert isinstance(cfg.TIMEOUT_SECONDS, (int, float)), "TIMEOUT_SECONDS should be numeric"
-            assert cfg.TIMEOUT_SECONDS > 0, "TIMEOUT_SECONDS should be positive"
-        
-        # Performance validation
-        execution_time = time.time() - start_time
-        assert execution_time < 5, f"Config validation took too long: {execution_time:.2f}s (should be < 5s)"
-        
-        print(f"✅ Configuration validation passed in {execution_time:.2f}s")
+        # Test 4: Optional fields have defaults if present
+        if hasattr(app_cfg, 'TIMEOUT_SECONDS'):
+            assert isinstance(app_cfg.TIMEOUT_SECONDS, (int, float)), "TIMEOUT_SECONDS should be numeric"
+            assert app_cfg.TIMEOUT_SECONDS > 0, "TIMEOUT_SECONDS should be positive"
     
-    def test_state_file_corruption_recovery(self):
+    def test_state_file_corruption_recovery(self, tmp_path):
         """
         Test 2: State File Corruption Recovery
         
@@ -102,45 +169,30 @@ class TestHighValueFutureDevelopment:
         - Tests handling of missing required fields  
         - Tests migration system works correctly
         - Tests graceful degradation with partial data
-        
-        Target: < 8 seconds execution time
         """
-        start_time = time.time()
+        from src.core.metrics_calculator import calculate_daily_progress
+        from src.data.repository import AtomicJSONRepository
         
         # Test 1: Malformed JSON recovery
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-            malformed_json_path = temp_file.name
-            temp_file.write('{"incomplete": "json", "missing_bracket":')  # Invalid JSON
-        
-        try:
-            # Try to load corrupted state
-            with open(malformed_json_path, 'r') as f:
-                try:
-                    data = json.load(f)
-                    recovery_failed = True  # Should not succeed
-                except json.JSONDecodeError:
-                    recovery_failed = False  # Expected behavior
-            
-            assert not recovery_failed, "Should gracefully handle malformed JSON"
-            
-            # Test that system can create new state when corruption detected
-            minimal_state = {
-                'daily_lessons_completed': 0,
-                'daily_goal_lessons': 12,
-                'total_lessons_completed': 0,
-                'last_scrape_date': '2025-07-06'
-            }
-            
-            progress_result = calculate_daily_progress(minimal_state)
-            assert progress_result is not None, "Should create valid progress from minimal state"
-            assert 'completed' in progress_result, "Progress should contain completed field"
-            
-        finally:
-            # Cleanup
-            try:
-                os.unlink(malformed_json_path)
-            except:
-                pass
+        with pytest.raises(json.JSONDecodeError):
+            json.loads('{"incomplete": "json", "missing_bracket":')  # Invalid JSON
+        
+        # Test that system can create new state when corruption detected
+        minimal_state = {
+            'daily_lessons_completed': 0,
+            'daily_goal_lessons': 12,
+            'total_lessons_completed': 0,
+            'last_scrape_date': '2025-07-06'
+        }
+        
+        state_file = tmp_path / "state.json"
+        state_file.write_text('{"incomplete":')
+        recovered_state = AtomicJSONRepository(str(state_file), auto_migrate=False).load(minimal_state)
+        assert recovered_state == minimal_state, "Corrupt state file without backups should fall back to defaults"
+        
+        progress_result = calculate_daily_progress(minimal_state)
+        assert progress_result is not None, "Should create valid progress from minimal state"
+        assert 'completed' in progress_result, "Progress should contain completed field"
         
         # Test 2: Missing required fields recovery
         incomplete_state = {
@@ -148,26 +200,12 @@ class TestHighValueFutureDevelopment:
             # Missing daily_lessons_completed, daily_goal_lessons, etc.
         }
         
-        try:
-            # Should handle missing fields gracefully
-            progress_result = calculate_daily_progress(incomplete_state)
-            
-            # Some implementations may return None for insufficient data, others may use defaults
-            if progress_result is not None:
-                assert isinstance(progress_result, dict), "Progress result should be dict if not None"
-            
-            # Test should not crash - that's the main validation
-            graceful_handling = True
-            
-        except Exception as e:
-            # Only fail if it's a critical crash, not a handled exception
-            if "critical" in str(e).lower() or "fatal" in str(e).lower():
-                graceful_handling = False
-                pytest.fail(f"Critical failure in state recovery: {e}")
-            else:
-                graceful_handling = True  # Handled exception is acceptable
+        # Should handle missing fields without raising
+        progress_result = calculate_daily_progress(incomplete_state)
         
-        assert graceful_handling, "Should handle incomplete state gracefully"
+        # Some implementations may return None for insufficient data, others may use defaults
+        if progress_result is not None:
+            assert isinstance(progress_result, dict), "Progress result should be dict if not None"
         
         # Test 3: Schema migration handling
         old_schema_state = {
@@ -177,146 +215,87 @@ class TestHighValueFutureDevelopment:
             # Missing newer fields like daily_lessons_completed, schema_version
         }
         
-        try:
-            # Should be able to work with old schema or migrate gracefully
-            progress_result = calculate_daily_progress(old_schema_state)
-            
-            # Either returns valid result or None (both acceptable for old schema)
-            if progress_result is not None:
-                assert isinstance(progress_result, dict), "Old schema should produce valid result"
-            
-            migration_handled = True
-            
-        except Exception as e:
-            if "version" in str(e).lower() or "schema" in str(e).lower():
-                migration_handled = True  # Migration-related errors are acceptable
-            else:
-                migration_handled = False
-                pytest.fail(f"Unexpected error with old schema: {e}")
-        
-        assert migration_handled, "Should handle old schema gracefully"
+        # Should be able to work with old schema without raising
+        progress_result = calculate_daily_progress(old_schema_state)
         
-        # Performance validation
-        execution_time = time.time() - start_time
-        assert execution_time < 8, f"State corruption recovery took too long: {execution_time:.2f}s (should be < 8s)"
-        
-        print(f"✅ State corruption recovery passed in {execution_time:.2f}s")
+        # Either returns valid result or None (both acceptable for old schema)
+        if progress_result is not None:
+            assert isinstance(progress_result, dict), "Old schema should produce valid result"
     
-    def test_scraper_graceful_failure_handling(self):
+    def test_scraper_graceful_failure_handling(self, malformed_soup, monkeypatch):
         """
         Test 3: Scraper Graceful Failure Handling
         
         Prevents silent scraper failures that could break automation:
-        - Tests geckodriver missing scenario
+        - Tests scraper construction without touching the browser
         - Tests duome.eu unreachable conditions
         - Tests malformed HTML response handling
         - Tests timeout and browser crash recovery
-        
-        Target: < 10 seconds execution time
         """
-        start_time = time.time()
+        # Test 1: Scraper construction
+        from src.scrapers import enhanced_scraper
+        from src.scrapers.enhanced_scraper import (
+            EnhancedScraper, GracefulDegradationMode, ScrapingError
+        )
+        from src.scrapers.retry_handler import ErrorType, RetryConfig
         
-        # Test 1: Missing geckodriver handling
-        with patch('selenium.webdriver.Firefox') as mock_firefox:
-            # Simulate geckodriver not found error
-            mock_firefox.side_effect = Exception("geckodriver not found in PATH")
-            
-            try:
-                from src.scrapers.enhanced_scraper import EnhancedScraper
-                
-                # Should handle missing geckodriver gracefully
-                scraper = EnhancedScraper()
-                
-                # Try to scrape (should handle the error gracefully)
-                # Simulate browser setup failure without patching specific methods
-                try:
-                    # This should not crash the entire system
-                    result = {"error": "browser_setup_failed", "sessions": []}
-                    graceful_failure = True
-                except Exception as e:
-                    if "critical" in str(e).lower():
-                        graceful_failure = False
-                    else:
-                        graceful_failure = True
-                
-                assert graceful_failure, "Should handle missing geckodriver gracefully"
-                    
-            except ImportError:
-                # If scraper can't be imported due to missing dependencies, that's also acceptable
-                print("⚠️ Scraper import failed (acceptable in test environment)")
+        scraper = EnhancedScraper()
+        assert scraper.retry_handler is not None, "Scraper should initialize with a retry handler"
         
         # Test 2: Network failure handling
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-        
-        with patch('requests.get', return_value=mock_response):
-            # Should handle network failures gracefully
-            network_failure_handled = True
+        # duome.eu keeps answering 500; the scraper must retry, then fail with ScrapingError
+        def failing_scraper(error):
+            """Scraper whose browser fetch always raises error, with cache and alerts off"""
+            def fetch(username, headless=True):
+                raise error
             
-            try:
-                # Simulate network failure scenario
-                # Most scraper operations should handle this without crashing
-                error_data = {"error": "network_failure", "status_code": 500}
-                assert isinstance(error_data, dict), "Should return structured error data"
-                
-            except Exception as e:
-                if "network" in str(e).lower() or "connection" in str(e).lower():
-                    network_failure_handled = True  # Expected network error
-                else:
-                    network_failure_handled = False
-                    pytest.fail(f"Unexpected error in network failure handling: {e}")
-        
-        assert network_failure_handled, "Should handle network failures gracefully"
+            monkeypatch.setattr(enhanced_scraper, 'fetch_duome_data_with_update', fetch)
+            degradation_mode = GracefulDegradationMode()
+            degradation_mode.use_cached_data = False
+            degradation_mode.send_failure_notifications = False
+            return EnhancedScraper(RetryConfig(max_attempts=2), degradation_mode)
+        
+        # Retry delays are recorded on each attempt, so there is no need to wait them out
+        monkeypatch.setattr('src.scrapers.retry_handler.time.sleep', lambda seconds: None)
+        
+        scraper = failing_scraper(Exception("500 Internal Server Error"))
+        with pytest.raises(ScrapingError, match="All scraping methods failed"):
+            scraper.scrape_with_retry('testuser')
+        error_types = {attempt.error_type for attempt in scraper.retry_handler.retry_history}
+        assert ErrorType.SERVER_ERROR in error_types, "Server errors should be retried as SERVER_ERROR"
         
         # Test 3: Malformed data handling
-        malformed_html = "<html><body>Incomplete HTML without proper duome.eu structure"
+        # Try to find duome.eu specific elements (should come back empty, not raise)
+        sessions = malformed_soup.find_all('div', class_='nonexistent-class')
+        assert isinstance(sessions, list), "Should return empty list for missing elements"
+        assert len(sessions) == 0, "Should find no sessions in malformed HTML"
+        
+        # Test 4: Timeout handling
+        scraper = failing_scraper(TimeoutException("page load timed out"))
+        with pytest.raises(ScrapingError, match="All scraping methods failed"):
+            scraper.scrape_with_retry('testuser')
+        error_types = {attempt.error_type for attempt in scraper.retry_handler.retry_history}
+        assert ErrorType.TIMEOUT in error_types, "Browser timeouts should be retried as TIMEOUT"
+    
+    def test_empty_sessions_processing(self):
+        """
+        Test 4a: Empty Session Lists
         
-        # Should handle parsing failures gracefully
-        try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(malformed_html, 'html.parser')
-            
-            # Try to find duome.eu specific elements (should fail gracefully)
-            sessions = soup.find_all('div', class_='nonexistent-class')
-            assert isinstance(sessions, list), "Should return empty list for missing elements"
-            assert len(sessions) == 0, "Should find no sessions in malformed HTML"
-            
-            malformed_handled = True
-            
-        except Exception as e:
-            if "parsing" in str(e).lower() or "html" in str(e).lower():
-                malformed_handled = True  # Expected parsing error
-            else:
-                malformed_handled = False
-                pytest.fail(f"Unexpected error in HTML parsing: {e}")
-        
-        assert malformed_handled, "Should handle malformed HTML gracefully"
-        
-        # Test 4: Timeout handling simulation
-        def slow_operation():
-            time.sleep(0.1)  # Simulate slow operation
-            return {"sessions": [], "timeout": True}
-        
-        try:
-            # Should complete quickly (simulated timeout handling)
-            result = slow_operation()
-            assert isinstance(result, dict), "Should return valid result structure"
-            timeout_handled = True
-            
-        except Exception as e:
-            timeout_handled = False
-            pytest.fail(f"Timeout simulation failed: {e}")
+        Prevents calculation errors when a scrape returns no sessions at all.
+        """
+        from src.core.metrics_calculator import calculate_performance_metrics, count_todays_lessons
         
-        assert timeout_handled, "Should handle timeout scenarios"
+        empty_scrape_data = dict(EDGE_CASES)["empty_sessions"]
         
-        # Performance validation
-        execution_time = time.time() - start_time
-        assert execution_time < 10, f"Scraper failure handling took too long: {execution_time:.2f}s (should be < 10s)"
+        assert count_todays_lessons(empty_scrape_data, '2025-07-06') == 0, "Empty sessions should return 0 lessons"
         
-        print(f"✅ Scraper graceful failure handling passed in {execution_time:.2f}s")
+        perf_metrics = calculate_performance_metrics(empty_scrape_data)
+        # May return None or empty dict for insufficient data
+        if perf_metrics is not None:
+            assert isinstance(perf_metrics, dict), "Performance metrics should be dict if not None"
     
-    def test_edge_case_data_processing(self):
+    @pytest.mark.parametrize("case_name,scrape_data", EDGE_CASES, ids=[name for name, _ in EDGE_CASES])
+    def test_edge_case_data_processing(self, case_name, scrape_data):
         """
         Test 4: Edge Case Data Processing
         
@@ -325,193 +304,41 @@ class TestHighValueFutureDevelopment:
         - Tests future dates in session data
         - Tests negative or zero XP values
         - Tests missing unit names and malformed session data
-        
-        Target: < 7 seconds execution time
+        - Tests extreme date ranges
         """
-        start_time = time.time()
-        
-        # Test 1: Empty session list handling
-        empty_scrape_data = {
-            "username": "testuser",
-            "sessions": [],
-            "computed_lesson_count": 0,
-            "computed_practice_count": 0,
-            "total_sessions": 0
-        }
+        from src.core.metrics_calculator import count_todays_lessons
         
-        try:
-            # Should handle empty sessions gracefully
-            lesson_count = count_todays_lessons(empty_scrape_data, '2025-07-06')
-            assert lesson_count == 0, "Empty sessions should return 0 lessons"
-            
-            perf_metrics = calculate_performance_metrics(empty_scrape_data)
-            # May return None or empty dict for insufficient data
-            if perf_metrics is not None:
-                assert isinstance(perf_metrics, dict), "Performance metrics should be dict if not None"
-            
-            empty_sessions_handled = True
-            
-        except Exception as e:
-            empty_sessions_handled = False
-            pytest.fail(f"Empty sessions handling failed: {e}")
-        
-        assert empty_sessions_handled, "Should handle empty sessions gracefully"
-        
-        # Test 2: Future dates in session data
-        future_scrape_data = {
-            "username": "testuser",
-            "sessions": [
-                {
-                    "datetime": "2030-01-01T12:00:00",  # Future date
-                    "date": "2030-01-01",
-                    "xp": 50,
-                    "session_type": "lesson",
-                    "is_lesson": True
-                }
-            ],
-            "computed_lesson_count": 1,
-            "total_sessions": 1
-        }
+        lesson_count = count_todays_lessons(scrape_data, '2025-07-06')
         
-        try:
-            # Should handle future dates without crashing
-            lesson_count = count_todays_lessons(future_scrape_data, '2025-07-06')
-            assert isinstance(lesson_count, int), "Should return integer for future dates"
-            assert lesson_count >= 0, "Lesson count should be non-negative"
-            
-            future_dates_handled = True
-            
-        except Exception as e:
-            future_dates_handled = False
-            pytest.fail(f"Future dates handling failed: {e}")
-        
-        assert future_dates_handled, "Should handle future dates gracefully"
-        
-        # Test 3: Negative and zero XP values
-        weird_xp_data = {
-            "username": "testuser", 
-            "sessions": [
-                {
-                    "datetime": "2025-07-06T12:00:00",
-                    "date": "2025-07-06",
-                    "xp": 0,  # Zero XP
-                    "session_type": "lesson",
-                    "is_lesson": True
-                },
-                {
-                    "datetime": "2025-07-06T13:00:00", 
-                    "date": "2025-07-06",
-                    "xp": -10,  # Negative XP (shouldn't happen but test anyway)
-                    "session_type": "practice",
-                    "is_lesson": True
-                }
-            ],
-            "computed_lesson_count": 2,
-            "total_sessions": 2
-        }
-        
-        try:
-            # Should handle weird XP values without crashing
-            lesson_count = count_todays_lessons(weird_xp_data, '2025-07-06')
-            assert isinstance(lesson_count, int), "Should return integer for weird XP"
-            assert lesson_count >= 0, "Lesson count should be non-negative even with weird XP"
-            
-            weird_xp_handled = True
-            
-        except Exception as e:
-            weird_xp_handled = False
-            pytest.fail(f"Weird XP values handling failed: {e}")
-        
-        assert weird_xp_handled, "Should handle unusual XP values gracefully"
-        
-        # Test 4: Missing unit names and malformed sessions
-        malformed_sessions_data = {
-            "username": "testuser",
-            "sessions": [
-                {
-                    "datetime": "2025-07-06T12:00:00",
-                    "date": "2025-07-06",
-                    "xp": 50,
-                    # Missing session_type
-                    "unit": None,  # Null unit
-                    "is_lesson": True
-                },
-                {
-                    "datetime": "2025-07-06T13:00:00",
-                    "date": "2025-07-06",
-                    # Missing xp field
-                    "session_type": "lesson",
-                    "unit": "",  # Empty unit name
-                    "is_lesson": True
-                },
-                {
-                    # Missing required fields
-                    "xp": 30
-                }
-            ],
-            "computed_lesson_count": 3,
-            "total_sessions": 3
-        }
-        
-        try:
-            # Should handle malformed sessions without crashing
-            lesson_count = count_todays_lessons(malformed_sessions_data, '2025-07-06')
-            assert isinstance(lesson_count, int), "Should return integer for malformed sessions"
-            assert lesson_count >= 0, "Lesson count should be non-negative"
-            
-            malformed_handled = True
-            
-        except Exception as e:
-            # Some level of error handling is acceptable for malformed data
-            if "required" in str(e).lower() or "missing" in str(e).lower():
-                malformed_handled = True  # Expected error for missing data
-            else:
-                malformed_handled = False
-                pytest.fail(f"Unexpected error with malformed sessions: {e}")
-        
-        assert malformed_handled, "Should handle malformed sessions gracefully"
-        
-        # Test 5: Extreme date ranges
-        extreme_date_data = {
-            "username": "testuser",
-            "sessions": [
-                {
-                    "datetime": "1900-01-01T00:00:00",  # Very old date
-                    "date": "1900-01-01", 
-                    "xp": 10,
-                    "session_type": "lesson",
-                    "is_lesson": True
-                },
-                {
-                    "datetime": "2100-12-31T23:59:59",  # Far future date
-                    "date": "2100-12-31",
-                    "xp": 20, 
-                    "session_type": "practice",
-                    "is_lesson": True
-                }
-            ],
-            "computed_lesson_count": 2,
-            "total_sessions": 2
+        assert isinstance(lesson_count, int), f"Should return integer for {case_name} data"
+        assert lesson_count >= 0, f"Lesson count should be non-negative for {case_name} data"
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(importlib.util.find_spec("pytest_benchmark") is None,
+                    reason="pytest-benchmark not installed")
+class TestHighValuePerformance:
+    """Opt-in benchmarks for the high-value paths (run with `make test-benchmark`)"""
+    
+    def test_perf_daily_progress_from_minimal_state(self, benchmark):
+        """Benchmark progress calculation for a freshly recovered state"""
+        from src.core.metrics_calculator import calculate_daily_progress
+        
+        minimal_state = {
+            'daily_lessons_completed': 0,
+            'daily_goal_lessons': 12,
+            'total_lessons_completed': 0,
+            'last_scrape_date': '2025-07-06'
         }
         
-        try:
-            # Should handle extreme dates without crashing
-            lesson_count = count_todays_lessons(extreme_date_data, '2025-07-06')
-            assert isinstance(lesson_count, int), "Should return integer for extreme dates"
-            
-            extreme_dates_handled = True
-            
-        except Exception as e:
-            extreme_dates_handled = False
-            pytest.fail(f"Extreme dates handling failed: {e}")
-        
-        assert extreme_dates_handled, "Should handle extreme date ranges"
-        
-        # Performance validation
-        execution_time = time.time() - start_time
-        assert execution_time < 7, f"Edge case data processing took too long: {execution_time:.2f}s (should be < 7s)"
+        progress_result = benchmark(calculate_daily_progress, minimal_state)
+        assert 'completed' in progress_result
+    
+    def test_perf_count_todays_lessons(self, benchmark, sample_session_data):
+        """Benchmark daily lesson counting"""
+        from src.core.metrics_calculator import count_todays_lessons
         
-        print(f"✅ Edge case data processing passed in {execution_time:.2f}s")
+        lesson_count = benchmark(count_todays_lessons, sample_session_data, '2025-06-28')
+        assert lesson_count == 2
 
 
 if __name__ == "__main__":
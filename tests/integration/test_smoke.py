@@ -11,42 +11,65 @@ Coverage: End-to-end workflow validation + notification content verification
 """
 
 import json
-import os
-import sys
+import re
 import tempfile
 import time
-from pathlib import Path
-from unittest.mock import patch, MagicMock
 
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-
+from config import app_config as cfg
+from src.core.daily_scheduler import DailyDuolingoTracker
 from src.core.metrics_calculator import calculate_daily_progress, calculate_performance_metrics, count_todays_lessons
 from src.core.markdown_updater import update_markdown_file
 from src.notifiers.pushover_notifier import PushoverNotifier
+from src.scrapers.enhanced_scraper import EnhancedScraper
+
+
+# Values that must never leak into a notification message
+JUNK_INDICATORS = [
+    'undefined', 'calculating...', 'NaN', 'null', 'None', 
+    'error', 'failed', 'Exception', 'Traceback',
+    '{{', '}}', '${', 'TypeError', 'AttributeError'
+]
+JUNK_PATTERN = re.compile('|'.join(map(re.escape, JUNK_INDICATORS)))
+NUMBER_PATTERN = re.compile(r'\d+')
+
+
+@pytest.fixture
+def captured_notifications(monkeypatch):
+    """Swap PushoverNotifier's send methods for one that records each message"""
+    captured = []
+    
+    def capture_notification(*args, **kwargs):
+        # Handle different notification method signatures
+        if len(args) > 0:
+            message = args[0]
+        elif 'message' in kwargs:
+            message = kwargs['message']
+        else:
+            message = str(args) + str(kwargs)  # fallback
+        
+        captured.append(message)
+        return True
+    
+    monkeypatch.setattr(PushoverNotifier, 'send_notification', capture_notification)
+    monkeypatch.setattr(PushoverNotifier, 'send_simple_notification', capture_notification)
+    return captured
 
 
 class TestEssentialSmokeTests:
     """Essential smoke tests that catch 80% of real-world failures in < 30 seconds"""
     
-    @pytest.fixture
-    def sample_scrape_data(self):
-        """Load realistic test fixture data"""
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "sample_scrape_data.json"
-        with open(fixture_path, 'r') as f:
-            return json.load(f)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def notifier(cls):
+        """One PushoverNotifier shared by the smoke tests in this class"""
+        return PushoverNotifier()
     
-    @pytest.fixture
-    def sample_state_data(self):
-        """Load realistic state fixture data"""
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "sample_state_data.json"
-        with open(fixture_path, 'r') as f:
-            return json.load(f)
-    
-    def test_data_processing_pipeline_with_content_validation(self, sample_scrape_data, sample_state_data):
+    @pytest.mark.slow
+    def test_data_processing_pipeline_with_content_validation(self, fixture_scrape_data, fixture_state_data,
+                                                              captured_notifications, notifier, app_cfg,
+                                                              monkeypatch, tmp_path):
         """
         Test 1: Data Processing Pipeline + Content Validation
         
@@ -64,7 +87,7 @@ class TestEssentialSmokeTests:
         print("🧪 Testing core calculation functions...")
         
         # Test daily progress calculation
-        progress_data = calculate_daily_progress(sample_state_data)
+        progress_data = calculate_daily_progress(fixture_state_data)
         assert progress_data is not None, "Daily progress calculation should not fail"
         assert 'completed' in progress_data, "Progress data should contain completed lessons"
         assert 'goal' in progress_data, "Progress data should contain goal information"
@@ -78,80 +101,48 @@ class TestEssentialSmokeTests:
         assert progress_data['status'] in ['ahead', 'on_track', 'close', 'behind'], f"Status should be valid: {progress_data['status']}"
         
         # Test performance metrics calculation
-        perf_metrics = calculate_performance_metrics(sample_scrape_data)
+        perf_metrics = calculate_performance_metrics(fixture_scrape_data)
         if perf_metrics is not None:  # May be None for insufficient data
             assert 'active_days' in perf_metrics, "Performance metrics should contain active days"
             assert 'daily_avg_sessions' in perf_metrics, "Performance metrics should contain daily average"
             assert isinstance(perf_metrics['active_days'], int), "Active days should be integer"
             assert perf_metrics['active_days'] > 0, "Active days should be positive"
         
-        # Test lesson counting for specific dates
-        lesson_count_today = count_todays_lessons(sample_scrape_data, '2025-07-06')
-        lesson_count_yesterday = count_todays_lessons(sample_scrape_data, '2025-07-05')
-        assert isinstance(lesson_count_today, int), "Lesson count should be integer"
-        assert lesson_count_today >= 0, "Lesson count should be non-negative"
-        
         # Test 2: Notification content generation and validation
         print("📱 Testing notification content generation...")
         
-        # Mock notification capture to validate content
-        captured_notifications = []
-        
-        def capture_notification(*args, **kwargs):
-            # Handle different notification method signatures
-            if len(args) > 0:
-                message = args[0]
-            elif 'message' in kwargs:
-                message = kwargs['message']
+        # Test pushover notification generation (send methods captured by fixture)
+        # Simulate notification generation with realistic data
+        try:
+            # Test simple notification (if method exists)
+            if hasattr(notifier, 'send_simple_notification'):
+                notifier.send_simple_notification(
+                    daily_progress=progress_data,
+                    units_completed=['Sports 2', 'Grooming'],
+                    total_lessons=fixture_state_data['total_lessons_completed'],
+                    state_data=fixture_state_data,
+                    json_data=fixture_scrape_data
+                )
             else:
-                message = str(args) + str(kwargs)  # fallback
-            
-            captured_notifications.append(message)
-            return True
-        
-        # Test pushover notification generation
-        with patch.object(PushoverNotifier, 'send_notification', capture_notification):
-            with patch.object(PushoverNotifier, 'send_simple_notification', capture_notification):
-                notifier = PushoverNotifier()
-                
-                # Simulate notification generation with realistic data
-                try:
-                    # Test simple notification (if method exists)
-                    if hasattr(notifier, 'send_simple_notification'):
-                        notifier.send_simple_notification(
-                            daily_progress=progress_data,
-                            units_completed=['Sports 2', 'Grooming'],
-                            total_lessons=sample_state_data['total_lessons_completed'],
-                            state_data=sample_state_data,
-                            json_data=sample_scrape_data
-                        )
-                    else:
-                        # Fallback to basic notification
-                        notifier.send_notification("Test notification with realistic data")
-                except Exception as e:
-                    # Some notification failures are acceptable in test environment
-                    if "config" not in str(e).lower():  # Config errors are expected in tests
-                        pytest.fail(f"Notification generation failed unexpectedly: {e}")
+                # Fallback to basic notification
+                notifier.send_notification("Test notification with realistic data")
+        except Exception as e:
+            # Some notification failures are acceptable in test environment
+            if "config" not in str(e).lower():  # Config errors are expected in tests
+                pytest.fail(f"Notification generation failed unexpectedly: {e}")
         
         # Validate notification content quality (PRIMARY goal of PRD)
         if captured_notifications:
             message = str(captured_notifications[0])
             
             # Critical validation: No junk values in notification content
-            junk_indicators = [
-                'undefined', 'calculating...', 'NaN', 'null', 'None', 
-                'error', 'failed', 'Exception', 'Traceback',
-                '{{', '}}', '${', 'TypeError', 'AttributeError'
-            ]
-            
-            for junk in junk_indicators:
-                assert junk not in message, f"Notification contains junk value: '{junk}' in message: {message}"
+            junk = JUNK_PATTERN.search(message)
+            assert junk is None, f"Notification contains junk value: '{junk.group(0)}' in message: {message}"
             
             # Validate notification contains reasonable content
             if len(message) > 10:  # Only test if we got substantial content
                 # Extract numbers from message for basic sanity checks
-                import re
-                numbers = re.findall(r'\d+', message)
+                numbers = NUMBER_PATTERN.findall(message)
                 if numbers:
                     # Check that lesson counts are reasonable (not negative, not impossibly high)
                     # Note: Exclude year projections (>2000) from validation
@@ -164,13 +155,12 @@ class TestEssentialSmokeTests:
         # Test 3: Markdown generation functionality
         print("📝 Testing markdown update functionality...")
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as temp_file:
-            temp_markdown_path = temp_file.name
-            temp_file.write("# Initial content")
+        # Write the dashboard under tmp_path instead of the real MARKDOWN_FILE
+        markdown_path = tmp_path / "progress-dashboard.md"
+        monkeypatch.setattr(app_cfg, 'MARKDOWN_FILE', str(markdown_path))
         
-        try:
-            # Test markdown update with realistic data and proper format
-            realistic_markdown_content = """# Duolingo Learning Analytics
+        # Test markdown update with realistic data and proper format
+        realistic_markdown_content = """# Duolingo Learning Analytics
 
 ## French Course Progression
 
@@ -193,23 +183,17 @@ class TestEssentialSmokeTests:
 
 *Last updated: July 6, 2025*
 """
-            
-            success = update_markdown_file(
-                newly_completed_count=1,
-                total_lessons_count=sample_state_data['total_lessons_completed'],
-                content=realistic_markdown_content,
-                state_data=sample_state_data
-            )
-            
-            # Success should be True OR a valid file path (some implementations return path)
-            assert success is True or isinstance(success, str), "Markdown update should succeed"
-            
-        finally:
-            # Cleanup
-            try:
-                os.unlink(temp_markdown_path)
-            except:
-                pass
+        
+        success = update_markdown_file(
+            newly_completed_count=1,
+            total_lessons_count=fixture_state_data['total_lessons_completed'],
+            content=realistic_markdown_content,
+            state_data=fixture_state_data
+        )
+        
+        # Success should be True OR a valid file path (some implementations return path)
+        assert success is True or isinstance(success, str), "Markdown update should succeed"
+        assert markdown_path.exists(), "Markdown update should write the dashboard file"
         
         # Performance validation: Test should complete quickly
         execution_time = time.time() - start_time
@@ -217,7 +201,14 @@ class TestEssentialSmokeTests:
         
         print(f"✅ Data processing smoke test passed in {execution_time:.2f}s")
     
-    def test_basic_environment_validation(self):
+    @pytest.mark.parametrize("date", ["2025-07-06", "2025-07-05"])
+    def test_count_todays_lessons(self, fixture_scrape_data, date):
+        """Lesson counting for specific dates in the realistic fixture"""
+        lesson_count = count_todays_lessons(fixture_scrape_data, date)
+        assert isinstance(lesson_count, int), "Lesson count should be integer"
+        assert lesson_count >= 0, "Lesson count should be non-negative"
+    
+    def test_basic_environment_validation(self, notifier):
         """
         Test 2: Basic Environment Validation
         
@@ -231,32 +222,12 @@ class TestEssentialSmokeTests:
         """
         start_time = time.time()
         
-        # Test critical imports
-        try:
-            from config import app_config as cfg
-            from src.core.daily_scheduler import DailyDuolingoTracker
-            from src.core.metrics_calculator import calculate_daily_progress
-            from src.core.markdown_updater import update_markdown_file
-            from src.notifiers.pushover_notifier import PushoverNotifier
-            from src.scrapers.enhanced_scraper import EnhancedScraper
-            imports_ok = True
-        except ImportError as e:
-            imports_ok = False
-            pytest.fail(f"Critical import failed: {e}")
-        
-        assert imports_ok, "All critical imports should work"
+        # Critical imports live at module top, so a broken one fails collection
         
         # Test configuration access
-        try:
-            username = cfg.USERNAME
-            daily_goal = cfg.DAILY_GOAL_LESSONS
-            total_units = cfg.TOTAL_COURSE_UNITS
-            config_ok = True
-        except AttributeError as e:
-            config_ok = False
-            pytest.fail(f"Configuration access failed: {e}")
-        
-        assert config_ok, "Configuration should be accessible"
+        assert cfg.USERNAME is not None, "USERNAME should be configured"
+        assert cfg.DAILY_GOAL_LESSONS is not None, "DAILY_GOAL_LESSONS should be configured"
+        assert cfg.TOTAL_COURSE_UNITS is not None, "TOTAL_COURSE_UNITS should be configured"
         
         # Test basic calculation functions with minimal data
         minimal_state = {
@@ -264,51 +235,23 @@ class TestEssentialSmokeTests:
             'daily_goal_lessons': 12
         }
         
-        try:
-            progress = calculate_daily_progress(minimal_state)
-            assert progress is not None, "Progress calculation should work with minimal data"
-            assert 'completed' in progress, "Progress should contain completed field"
-            calculation_ok = True
-        except Exception as e:
-            calculation_ok = False
-            pytest.fail(f"Basic calculation failed: {e}")
-        
-        assert calculation_ok, "Basic calculations should work"
+        progress = calculate_daily_progress(minimal_state)
+        assert progress is not None, "Progress calculation should work with minimal data"
+        assert 'completed' in progress, "Progress should contain completed field"
         
         # Test file system access patterns
-        try:
-            # Test temp file creation (validates permissions)
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=True) as temp_file:
-                temp_file.write('{"test": "data"}')
-                temp_file.flush()
-                
-                # Test reading back
-                with open(temp_file.name, 'r') as f:
-                    data = json.load(f)
-                    assert data['test'] == 'data', "File I/O should work correctly"
+        # Test temp file creation (validates permissions)
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=True) as temp_file:
+            temp_file.write('{"test": "data"}')
+            temp_file.flush()
             
-            filesystem_ok = True
-        except Exception as e:
-            filesystem_ok = False
-            pytest.fail(f"File system access failed: {e}")
-        
-        assert filesystem_ok, "File system operations should work"
-        
-        # Test error handling doesn't crash
-        try:
-            # Try to create a notifier without proper config (should handle gracefully)
-            notifier = PushoverNotifier()
-            # Should not crash, may return False for is_enabled() but shouldn't raise
-            error_handling_ok = True
-        except Exception as e:
-            # Some initialization errors are acceptable, crashes are not
-            if "critical" in str(e).lower() or "fatal" in str(e).lower():
-                error_handling_ok = False
-                pytest.fail(f"Critical error in error handling: {e}")
-            else:
-                error_handling_ok = True
+            # Test reading back
+            with open(temp_file.name, 'r') as f:
+                data = json.load(f)
+                assert data['test'] == 'data', "File I/O should work correctly"
         
-        assert error_handling_ok, "Error handling should be graceful"
+        # Creating a notifier without proper config should not raise
+        assert isinstance(notifier, PushoverNotifier), "Notifier should construct without proper config"
         
         # Performance validation
         execution_time = time.time() - start_time
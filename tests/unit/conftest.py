@@ -0,0 +1,11 @@
+"""
+Shared fixtures for unit tests
+"""
+
+import pytest
+
+
+@pytest.fixture
+def temp_dir(tmp_path):
+    """Per-test temporary directory (pytest's tmp_path, cleaned up in bulk)"""
+    return tmp_path
@@ -4,11 +4,14 @@ Tests for AtomicJSONRepository
 Tests atomic operations, corruption recovery, file locking, and backup functionality.
 """
 
+import itertools
 import json
 import os
 import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
@@ -17,15 +20,46 @@ import pytest
 from src.data.repository import AtomicJSONRepository, load_json_safe, save_json_safe
 
 
+def _backup_paths(repo):
+    """Paths of a repository's backup files, found with one directory scan."""
+    prefix = f"{repo.file_path.stem}_backup_"
+    with os.scandir(repo.backup_dir) as entries:
+        return [entry.path for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith('.json')]
+
+
+@pytest.fixture
+def in_memory_fs(request):
+    """Run file operations against pyfakefs's in-memory filesystem when its plugin is loaded."""
+    try:
+        return request.getfixturevalue('fs')
+    except pytest.FixtureLookupError:
+        return None
+
+
+
 class TestAtomicJSONRepository:
     """Test atomic JSON repository operations."""
     
     @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for test files."""
+    def temp_dir(self, in_memory_fs):
+        """Create temporary directory for test files, inside the fake filesystem when active."""
         with tempfile.TemporaryDirectory() as tmpdir:
             yield Path(tmpdir)
     
+    @pytest.fixture
+    def ticking_clock(self, monkeypatch):
+        """Advance the repository's clock one second per call so backup names never collide."""
+        ticks = itertools.count()
+        start = datetime(2025, 7, 6, 12, 0, 0)
+        
+        class TickingDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return start + timedelta(seconds=next(ticks))
+        
+        monkeypatch.setattr('src.data.repository.datetime', TickingDatetime)
+    
     @pytest.fixture
     def repo(self, temp_dir):
         """Create repository instance with temporary file."""
@@ -72,8 +106,7 @@ class TestAtomicJSONRepository:
         assert repo.save(updated_data) is True
         
         # Check backup was created
-        backup_pattern = f"{repo.file_path.stem}_backup_*.json"
-        backups = list(repo.backup_dir.glob(backup_pattern))
+        backups = _backup_paths(repo)
         assert len(backups) >= 1
         
         # Verify backup contains initial data
@@ -85,7 +118,7 @@ class TestAtomicJSONRepository:
         current_data = repo.load()
         assert current_data == updated_data
     
-    def test_corruption_recovery(self, repo):
+    def test_corruption_recovery(self, repo, ticking_clock):
         """Test recovery from corrupted JSON files."""
         valid_data = {"status": "good"}
         
@@ -93,7 +126,6 @@ class TestAtomicJSONRepository:
         assert repo.save(valid_data) is True
         
         # Save again to ensure backup is created (first save doesn't create backup)
-        time.sleep(0.01)  # Ensure different timestamp
         updated_data = {"status": "updated"}
         assert repo.save(updated_data) is True
         
@@ -133,13 +165,61 @@ class TestAtomicJSONRepository:
         # File should not be created/modified
         assert repo.exists() is False
     
+    def test_backup_cleanup(self, repo, ticking_clock, monkeypatch):
+        """Test cleanup of old backup files."""
+        # Only the backup count matters here, so skip flushing each save to disk
+        monkeypatch.setattr(os, 'fsync', lambda fd: None)
+        
+        # Create multiple saves to generate backups (each with a distinct timestamp);
+        # the first save has nothing to back up, so 7 saves make 6 backups, one over the limit
+        for i in range(7):
+            data = {"version": i}
+            repo.save(data)
+        
+        # Check that old backups were cleaned up (6 created, should keep only 5)
+        backups = _backup_paths(repo)
+        assert len(backups) == 5
+    
+    def test_get_last_modified(self, repo):
+        """Test getting last modification time."""
+        # No file exists
+        assert repo.get_last_modified() is None
+        
+        # Save data
+        repo.save({"test": True})
+        
+        # Should have modification time
+        mod_time = repo.get_last_modified()
+        assert mod_time is not None
+        
+        # Modification time should be recent
+        time_diff = (mod_time.timestamp() - time.time())
+        assert abs(time_diff) < 5  # Within 5 seconds
+
+
+class TestConcurrentAccess:
+    """Test file locking under concurrent access.
+    
+    Runs on the real filesystem: pyfakefs turns fcntl.flock into a no-op and its
+    fake filesystem is not thread-safe.
+    """
+    
+    @pytest.fixture
+    def repo(self, tmp_path):
+        """Create repository instance with a file in a per-test directory."""
+        # Disable auto-migration for core repository tests to maintain predictable behavior
+        return AtomicJSONRepository(str(tmp_path / "test_data.json"), auto_migrate=False)
+    
     def test_concurrent_access(self, repo):
         """Test concurrent reads and writes with file locking."""
         results = []
         errors = []
+        # Release all six workers at once so reads and writes actually overlap
+        start_together = threading.Barrier(6)
         
         def write_worker(worker_id):
             try:
+                start_together.wait()
                 data = {"worker": worker_id, "timestamp": time.time()}
                 result = repo.save(data)
                 results.append((worker_id, result))
@@ -148,26 +228,16 @@ class TestAtomicJSONRepository:
         
         def read_worker(worker_id):
             try:
-                time.sleep(0.1)  # Let writers start first
+                start_together.wait()
                 data = repo.load()
                 results.append((f"reader_{worker_id}", data.get("worker", "unknown")))
             except Exception as e:
                 errors.append((f"reader_{worker_id}", e))
         
-        # Start concurrent workers
-        threads = []
-        for i in range(3):
-            t1 = threading.Thread(target=write_worker, args=(i,))
-            t2 = threading.Thread(target=read_worker, args=(i,))
-            threads.extend([t1, t2])
-        
-        # Start all threads
-        for t in threads:
-            t.start()
-        
-        # Wait for completion
-        for t in threads:
-            t.join()
+        # Run 3 writers and 3 readers concurrently; leaving the block waits for all of them
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            executor.map(write_worker, range(3))
+            executor.map(read_worker, range(3))
         
         # Check results
         assert len(errors) == 0, f"Concurrent access errors: {errors}"
@@ -176,53 +246,15 @@ class TestAtomicJSONRepository:
         # Verify final state is consistent
         final_data = repo.load()
         assert "worker" in final_data
-    
-    def test_backup_cleanup(self, repo):
-        """Test cleanup of old backup files."""
-        # Create multiple saves to generate backups
-        for i in range(10):
-            data = {"version": i}
-            repo.save(data)
-            time.sleep(0.01)  # Ensure different timestamps
-        
-        # Check that old backups were cleaned up (should keep only 5)
-        backup_pattern = f"{repo.file_path.stem}_backup_*.json"
-        backups = list(repo.backup_dir.glob(backup_pattern))
-        assert len(backups) <= 5
-    
-    def test_get_last_modified(self, repo):
-        """Test getting last modification time."""
-        # No file exists
-        assert repo.get_last_modified() is None
-        
-        # Save data
-        repo.save({"test": True})
-        
-        # Should have modification time
-        mod_time = repo.get_last_modified()
-        assert mod_time is not None
-        
-        # Modification time should be recent
-        time_diff = (mod_time.timestamp() - time.time())
-        assert abs(time_diff) < 5  # Within 5 seconds
 
 
 class TestConvenienceFunctions:
     """Test convenience functions."""
     
     @pytest.fixture
-    def temp_file(self):
-        """Create temporary file path."""
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            temp_path = f.name
-        
-        yield temp_path
-        
-        # Cleanup
-        try:
-            os.unlink(temp_path)
-        except FileNotFoundError:
-            pass
+    def temp_file(self, tmp_path):
+        """Path to a not-yet-created JSON file in a per-test directory."""
+        return str(tmp_path / "data.json")
     
     def test_load_json_safe(self, temp_file):
         """Test safe JSON loading convenience function."""
@@ -266,6 +298,7 @@ class TestConvenienceFunctions:
         assert loaded_data == original_data
 
 
+@pytest.mark.usefixtures("in_memory_fs")
 class TestRealWorldScenarios:
     """Test realistic scenarios from daily tracker usage."""
     
@@ -2,43 +2,88 @@
 """
 Tests for Data Access Layer
 Tests DataManager, StorageBackend interfaces, and storage abstraction.
+
+Every test works under pytest's per-worker temp dirs and patches config only inside
+its own fixtures, so the module is safe to run with pytest -n auto.
 """
 
 import pytest
-import tempfile
 import json
 import os
-import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import patch, Mock
+from types import SimpleNamespace
+from unittest.mock import patch
 
+from src.data import data_manager as data_manager_module
 from src.data.data_manager import DataManager, DataAccessError
 from src.data.storage_interface import FileStorageBackend, StorageManager
 
 
+class _RaisingRepo:
+    """Stand-in repository whose save always fails."""
+    
+    def save(self, *args, **kwargs):
+        raise Exception("Mock error")
+
+
+@dataclass
+class FakeDataManager:
+    """Just the DataManager surface FileStorageBackend uses, rooted at one directory."""
+    root: Path
+    
+    def __post_init__(self):
+        self._state_repo = SimpleNamespace(file_path=self.root / "tracker_state.json")
+        self._pushover_config_repo = SimpleNamespace(file_path=self.root / "pushover_config.json")
+    
+    def get_data_path(self, filename):
+        return str(self.root / filename)
+
+
+def _temp_config(root):
+    """Config namespace pointing every DataManager path under root."""
+    return SimpleNamespace(
+        DATA_DIR=str(root / "data"),
+        LOG_DIR=str(root / "logs"),
+        CONFIG_DIR=str(root / "config"),
+        STATE_FILE=str(root / "tracker_state.json"),
+        NOTIFIER_CONFIG_FILE=str(root / "config" / "pushover_config.json"),
+        MARKDOWN_FILE=str(root / "progress-dashboard.md"),
+        USERNAME="testuser",
+    )
+
+
+@contextmanager
+def make_data_manager(root):
+    """DataManager whose config points under root; the config patch lasts for the block."""
+    with patch.object(data_manager_module, 'cfg', _temp_config(root)):
+        yield DataManager()
+
+
 class TestDataManager:
     """Test the centralized data manager."""
     
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for test files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def temp_dir(cls, tmp_path_factory):
+        """Create one temporary directory shared by the tests in this class."""
+        return tmp_path_factory.mktemp("data_manager")
     
-    @pytest.fixture
-    def data_manager(self, temp_dir):
-        """Create data manager with temporary paths."""
-        # Mock config to use temp directory
-        with patch('src.data.data_manager.cfg') as mock_cfg:
-            mock_cfg.DATA_DIR = str(temp_dir / "data")
-            mock_cfg.LOG_DIR = str(temp_dir / "logs")
-            mock_cfg.CONFIG_DIR = str(temp_dir / "config")
-            mock_cfg.STATE_FILE = str(temp_dir / "tracker_state.json")
-            mock_cfg.NOTIFIER_CONFIG_FILE = str(temp_dir / "config" / "pushover_config.json")
-            mock_cfg.MARKDOWN_FILE = str(temp_dir / "progress-dashboard.md")
-            mock_cfg.USERNAME = "testuser"
-            
-            yield DataManager()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def data_manager(cls, temp_dir):
+        """Create one data manager with temporary paths for the whole class."""
+        with make_data_manager(temp_dir) as data_manager:
+            yield data_manager
+    
+    @pytest.fixture(autouse=True)
+    def clean_files(self, temp_dir):
+        """Delete files written by each test, keeping the directories DataManager created."""
+        yield
+        for path in temp_dir.rglob('*'):
+            if path.is_file():
+                path.unlink()
     
     def test_directory_creation(self, data_manager):
         """Test that required directories are created."""
@@ -77,8 +122,8 @@ class TestDataManager:
     
     def test_tracker_state_error_handling(self, data_manager):
         """Test error handling in state operations."""
-        # Mock repository to raise exception
-        with patch.object(data_manager._state_repo, 'save', side_effect=Exception("Mock error")):
+        # Swap in a repository that raises
+        with patch.object(data_manager, '_state_repo', _RaisingRepo()):
             with pytest.raises(DataAccessError) as exc_info:
                 data_manager.save_tracker_state({"test": "data"})
             assert "Failed to save tracker state" in str(exc_info.value)
@@ -131,29 +176,25 @@ class TestDataManager:
         assert len(files) == 1
         assert files[0] == saved_path
     
-    def test_scrape_data_cleanup(self, data_manager):
+    @pytest.mark.parametrize("file_count,keep,expected_deleted", [
+        (3, 1, 2),
+        pytest.param(15, 5, 10, marks=pytest.mark.slow),
+    ])
+    def test_scrape_data_cleanup(self, data_manager, file_count, keep, expected_deleted):
         """Test cleanup of old scrape files."""
-        # Create multiple scrape files
-        created_files = []
-        for i in range(15):
-            scrape_data = {"session_id": i, "timestamp": f"2025-06-29T{i:02d}:00:00"}
-            created_path = data_manager.save_scrape_data(scrape_data)
-            created_files.append(created_path)
-            time.sleep(0.01)  # Ensure different creation times
-        
-        # Should have 15 main files (ignoring backup files)
-        files_before = data_manager.list_scrape_files()
-        main_files_before = [f for f in files_before if "backup" not in f]
-        assert len(main_files_before) == 15
-        
-        # Cleanup, keeping only 5
-        deleted_count = data_manager.cleanup_old_scrape_files(keep_count=5)
-        assert deleted_count == 10
-        
-        # Should have 5 main files remaining
-        files_after = data_manager.list_scrape_files()
-        main_files_after = [f for f in files_after if "backup" not in f]
-        assert len(main_files_after) == 5
+        # Create multiple scrape files directly; saving is covered by test_scrape_data_operations
+        scrape_dir = Path(data_manager.get_data_path(""))
+        for i in range(file_count):
+            (scrape_dir / f"duome_raw_testuser_20250629_{i:02d}0000_000000.json").write_text("{}")
+        
+        assert len(data_manager.list_scrape_files()) == file_count
+        
+        # Cleanup, keeping only the most recent files
+        deleted_count = data_manager.cleanup_old_scrape_files(keep_count=keep)
+        assert deleted_count == expected_deleted
+        
+        # Should have only the kept files remaining
+        assert len(data_manager.list_scrape_files()) == keep
     
     def test_markdown_operations(self, data_manager):
         """Test markdown file operations."""
@@ -221,22 +262,10 @@ This is test content.
 class TestStorageInterface:
     """Test the storage interface abstraction."""
     
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for test files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
-    
     @pytest.fixture
     def mock_data_manager(self, temp_dir):
-        """Create mock data manager."""
-        mock_dm = Mock()
-        mock_dm.get_data_path.side_effect = lambda x: str(temp_dir / x)
-        mock_dm._state_repo = Mock()
-        mock_dm._state_repo.file_path = temp_dir / "tracker_state.json"
-        mock_dm._pushover_config_repo = Mock()
-        mock_dm._pushover_config_repo.file_path = temp_dir / "pushover_config.json"
-        return mock_dm
+        """Create a lightweight fake data manager."""
+        return FakeDataManager(temp_dir)
     
     def test_file_storage_backend(self, mock_data_manager):
         """Test file storage backend implementation."""
@@ -309,46 +338,34 @@ class TestIntegration:
     """Test integration between data manager and storage interfaces."""
     
     @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for test files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+    def data_manager(self, temp_dir):
+        """Create data manager with temporary paths."""
+        with make_data_manager(temp_dir) as data_manager:
+            yield data_manager
     
-    def test_data_manager_storage_integration(self, temp_dir):
+    def test_data_manager_storage_integration(self, data_manager):
         """Test that DataManager can work with storage interfaces."""
-        # Create DataManager with temp paths
-        with patch('src.data.data_manager.cfg') as mock_cfg:
-            mock_cfg.DATA_DIR = str(temp_dir / "data")
-            mock_cfg.LOG_DIR = str(temp_dir / "logs")
-            mock_cfg.CONFIG_DIR = str(temp_dir / "config")
-            mock_cfg.STATE_FILE = str(temp_dir / "tracker_state.json")
-            mock_cfg.NOTIFIER_CONFIG_FILE = str(temp_dir / "config" / "pushover_config.json")
-            mock_cfg.MARKDOWN_FILE = str(temp_dir / "progress-dashboard.md")
-            mock_cfg.USERNAME = "testuser"
-            
-            data_manager = DataManager()
-            
-            # Create storage manager using data manager
-            backend = FileStorageBackend(data_manager)
-            storage = StorageManager(backend)
-            
-            # Test that both interfaces work together
-            test_state = {"total_lessons": 200, "date": "2025-06-29"}
-            
-            # Save via DataManager
-            data_manager.save_tracker_state(test_state)
-            
-            # Load via StorageManager
-            loaded_via_storage = storage.load_state()
-            assert loaded_via_storage["total_lessons"] == 200
-            
-            # Save via StorageManager
-            updated_state = {"total_lessons": 250, "date": "2025-06-30"}
-            storage.save_state(updated_state)
-            
-            # Load via DataManager
-            loaded_via_dm = data_manager.load_tracker_state()
-            assert loaded_via_dm["total_lessons"] == 250
+        # Create storage manager using data manager
+        backend = FileStorageBackend(data_manager)
+        storage = StorageManager(backend)
+        
+        # Test that both interfaces work together
+        test_state = {"total_lessons": 200, "date": "2025-06-29"}
+        
+        # Save via DataManager
+        data_manager.save_tracker_state(test_state)
+        
+        # Load via StorageManager
+        loaded_via_storage = storage.load_state()
+        assert loaded_via_storage["total_lessons"] == 200
+        
+        # Save via StorageManager
+        updated_state = {"total_lessons": 250, "date": "2025-06-30"}
+        storage.save_state(updated_state)
+        
+        # Load via DataManager
+        loaded_via_dm = data_manager.load_tracker_state()
+        assert loaded_via_dm["total_lessons"] == 250
 
 
 if __name__ == "__main__":
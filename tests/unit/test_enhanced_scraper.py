@@ -5,18 +5,18 @@ Tests retry logic integration, graceful degradation, and fallback mechanisms.
 """
 
 import pytest
-import tempfile
-import json
 import time
 import os
-from unittest.mock import Mock, patch, MagicMock
+from contextlib import contextmanager
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
 from datetime import datetime, timedelta
-from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 
 from src.scrapers.enhanced_scraper import (
-    EnhancedScraper, ScrapingError, GracefulDegradationMode
+    EnhancedScraper, ScrapingError, GracefulDegradationMode, scrape_duome_enhanced
 )
 from src.scrapers.retry_handler import RetryConfig
+from src.notifiers.pushover_notifier import PushoverNotifier
 
 
 class TestGracefulDegradationMode:
@@ -48,37 +48,64 @@ class TestGracefulDegradationMode:
         assert mode.should_use_cache(12) is False
 
 
+# Cache lookups are fully mocked, so no file ever needs to exist at this path
+FAKE_CACHE_PATH = "/fake/cached_scrape.json"
+
+# Sample timestamps only need to be recent, so they are computed once per module
+_NOW = datetime.now()
+_NOW_ISO = _NOW.isoformat()
+_NOW_MINUS_2H_ISO = (_NOW - timedelta(hours=2)).isoformat()
+
+# Cache file ctimes either side of the 24-hour cache threshold
+_IMPORT_TIME = time.time()
+_OLD_CTIME = _IMPORT_TIME - (25 * 3600)  # 25 hours old
+_RECENT_CTIME = _IMPORT_TIME - (2 * 3600)  # 2 hours old
+
+
+@contextmanager
+def swap_methods(obj, **replacements):
+    """Shadow methods with plain callables on the instance, for tests that don't inspect calls."""
+    vars(obj).update(replacements)
+    try:
+        yield
+    finally:
+        for name in replacements:
+            vars(obj).pop(name, None)
+
+
 # Module-level fixtures
-@pytest.fixture
-def temp_dir():
-    """Create temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+# The scraper and its mocks are built once per module; _reset_scraper_state
+# puts back everything a test may have changed.
+def _configure_data_manager(stub_dm, root):
+    """Give the stub data manager its default file-operation results."""
+    stub_dm.find_latest_scrape_file = lambda *args, **kwargs: None
+    stub_dm.save_scrape_data = lambda *args, **kwargs: str(root / "test_scrape.json")
+    stub_dm.cleanup_old_scrape_files = lambda *args, **kwargs: 0
+    stub_dm.health_check = lambda: {"status": "healthy"}
+    stub_dm.load_scrape_data = lambda *args, **kwargs: None
 
-@pytest.fixture
-def mock_data_manager(temp_dir):
-    """Create mock data manager."""
-    with patch('src.scrapers.enhanced_scraper.DataManager') as MockDataManager:
-        mock_dm = Mock()
-        MockDataManager.return_value = mock_dm
-        
-        # Mock file operations
-        mock_dm.find_latest_scrape_file.return_value = None
-        mock_dm.save_scrape_data.return_value = str(temp_dir / "test_scrape.json")
-        mock_dm.cleanup_old_scrape_files.return_value = 0
-        mock_dm.health_check.return_value = {"status": "healthy"}
-        
-        yield mock_dm
+@pytest.fixture(scope="module")
+def scrape_root(tmp_path_factory):
+    """Temporary directory the mock data manager reports paths under."""
+    return tmp_path_factory.mktemp("enhanced_scraper")
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def mock_data_manager(scrape_root):
+    """Create stub data manager; no test inspects its calls, so plain callables suffice."""
+    stub_dm = SimpleNamespace()
+    _configure_data_manager(stub_dm, scrape_root)
+    with patch('src.scrapers.enhanced_scraper.DataManager', return_value=stub_dm):
+        yield stub_dm
+
+@pytest.fixture(scope="module")
 def mock_notifier():
     """Create mock notification handler."""
     with patch('src.scrapers.enhanced_scraper.PushoverNotifier') as MockNotifier:
-        mock_notifier = Mock()
+        mock_notifier = Mock(spec=PushoverNotifier)
         MockNotifier.return_value = mock_notifier
         yield mock_notifier
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def enhanced_scraper(mock_data_manager, mock_notifier):
     """Create enhanced scraper for testing."""
     retry_config = RetryConfig(
@@ -90,20 +117,50 @@ def enhanced_scraper(mock_data_manager, mock_notifier):
     
     return EnhancedScraper(retry_config, degradation_mode)
 
+@pytest.fixture(scope="session")
+def canned_retry_stats():
+    """Retry statistics for a persistent failure (shared, read-only)."""
+    return MappingProxyType({
+        'total_attempts': 5,
+        'error_types': MappingProxyType({'network': 3, 'timeout': 2}),
+        'circuit_breaker': MappingProxyType({'state': 'open'})
+    })
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Skip real backoff sleeps so retry chains cost no wall-clock time."""
+    monkeypatch.setattr('src.scrapers.retry_handler.time.sleep', lambda *_: None)
+
+@pytest.fixture(autouse=True)
+def _reset_scraper_state(request, scrape_root):
+    """Undo per-test changes to the shared scraper and its test doubles."""
+    yield
+    if 'enhanced_scraper' not in request.fixturenames:
+        return
+    scraper = request.getfixturevalue('enhanced_scraper')
+    mock_notifier = request.getfixturevalue('mock_notifier')
+    scraper.reset_circuit_breaker()
+    scraper.degradation_mode = GracefulDegradationMode()
+    scraper.notifier = mock_notifier
+    mock_notifier.reset_mock(return_value=True, side_effect=True)
+    _configure_data_manager(scraper.data_manager, scrape_root)
+
 @pytest.fixture
 def sample_scrape_data():
     """Sample scraped data for testing."""
+    # A fresh dict per test: the validator requires a real dict and the
+    # cached-data fallback marks the returned data in place
     return {
         'username': 'testuser',
-        'scraped_at': datetime.now().isoformat(),
+        'scraped_at': _NOW_ISO,
         'sessions': [
             {
-                'date': datetime.now().isoformat(),
+                'date': _NOW_ISO,
                 'type': 'lesson',
                 'skill': 'Animals'
             },
             {
-                'date': (datetime.now() - timedelta(hours=2)).isoformat(),
+                'date': _NOW_MINUS_2H_ISO,
                 'type': 'practice',
                 'skill': 'Food'
             }
@@ -138,41 +195,23 @@ class TestDataValidation:
         """Test validation of high-quality data."""
         assert enhanced_scraper._validate_data_quality(sample_scrape_data) is True
     
-    def test_low_quality_data(self, enhanced_scraper):
-        """Test validation of low-quality data."""
-        low_quality_data = {
-            'username': 'testuser',
-            'sessions': []  # No sessions
-        }
-        
-        assert enhanced_scraper._validate_data_quality(low_quality_data) is False
-    
-    def test_invalid_data_types(self, enhanced_scraper):
-        """Test validation of invalid data types."""
-        assert enhanced_scraper._validate_data_quality(None) is False
-        assert enhanced_scraper._validate_data_quality("not a dict") is False
-        assert enhanced_scraper._validate_data_quality([]) is False
-    
-    def test_missing_essential_fields(self, enhanced_scraper):
-        """Test validation with missing essential fields."""
-        incomplete_data = {
-            'username': 'testuser'
-            # Missing sessions and scraped_at
-        }
-        
-        assert enhanced_scraper._validate_data_quality(incomplete_data) is False
-    
-    def test_empty_sessions(self, enhanced_scraper):
-        """Test validation with empty sessions."""
-        data_with_empty_sessions = {
+    @pytest.mark.parametrize("payload", [
+        pytest.param(None, id="none"),
+        pytest.param("not a dict", id="string"),
+        pytest.param([], id="list"),
+        pytest.param({'username': 'testuser', 'sessions': []}, id="no_sessions"),
+        pytest.param({'username': 'testuser'}, id="missing_essential_fields"),
+        pytest.param({
             'username': 'testuser',
-            'scraped_at': datetime.now().isoformat(),
+            'scraped_at': _NOW_ISO,
             'sessions': [],
             'computed_total_sessions': 0,
             'computed_lesson_count': 0
-        }
-        
-        assert enhanced_scraper._validate_data_quality(data_with_empty_sessions) is False
+        }, id="empty_sessions"),
+    ])
+    def test_rejects_low_quality_data(self, enhanced_scraper, payload):
+        """Test validation rejects invalid types and low-quality data."""
+        assert enhanced_scraper._validate_data_quality(payload) is False
 
 
 class TestCachedDataFallback:
@@ -180,54 +219,43 @@ class TestCachedDataFallback:
     
     def test_no_cached_data_available(self, enhanced_scraper):
         """Test when no cached data is available."""
-        enhanced_scraper.data_manager.find_latest_scrape_file.return_value = None
+        enhanced_scraper.data_manager.find_latest_scrape_file = lambda *args, **kwargs: None
         
         result = enhanced_scraper._try_cached_data_fallback('testuser')
         assert result is None
     
-    def test_cached_data_too_old(self, enhanced_scraper, temp_dir):
+    @patch('os.path.getctime', return_value=_OLD_CTIME)
+    def test_cached_data_too_old(self, mock_getctime, enhanced_scraper):
         """Test when cached data is too old."""
-        # Create old file
-        old_file = temp_dir / "old_scrape.json"
-        old_file.write_text("{}")
+        enhanced_scraper.data_manager.find_latest_scrape_file = lambda *args, **kwargs: FAKE_CACHE_PATH
         
-        # Mock file age to be 25 hours (beyond 24-hour threshold)
-        old_time = time.time() - (25 * 3600)
-        with patch('os.path.getctime', return_value=old_time):
-            enhanced_scraper.data_manager.find_latest_scrape_file.return_value = str(old_file)
-            
-            result = enhanced_scraper._try_cached_data_fallback('testuser')
-            assert result is None
+        result = enhanced_scraper._try_cached_data_fallback('testuser')
+        assert result is None
     
-    def test_cached_data_low_quality(self, enhanced_scraper, temp_dir, sample_scrape_data):
+    @patch('os.path.getctime', return_value=_RECENT_CTIME)
+    def test_cached_data_low_quality(self, mock_getctime, enhanced_scraper):
         """Test when cached data has low quality."""
-        # Create cached file with low-quality data
-        cached_file = temp_dir / "cached_scrape.json"
         low_quality_data = {'username': 'testuser', 'sessions': []}
-        cached_file.write_text(json.dumps(low_quality_data))
-        
-        enhanced_scraper.data_manager.find_latest_scrape_file.return_value = str(cached_file)
-        enhanced_scraper.data_manager.load_scrape_data.return_value = low_quality_data
+        enhanced_scraper.data_manager.find_latest_scrape_file = lambda *args, **kwargs: FAKE_CACHE_PATH
+        enhanced_scraper.data_manager.load_scrape_data = lambda *args, **kwargs: low_quality_data
         
         result = enhanced_scraper._try_cached_data_fallback('testuser')
         assert result is None
     
-    def test_successful_cached_data_fallback(self, enhanced_scraper, temp_dir, sample_scrape_data):
+    @patch('os.path.getctime', return_value=_RECENT_CTIME)
+    def test_successful_cached_data_fallback(self, mock_getctime, enhanced_scraper, sample_scrape_data):
         """Test successful use of cached data."""
-        # Create recent cached file
-        cached_file = temp_dir / "cached_scrape.json"
-        recent_time = time.time() - (2 * 3600)  # 2 hours old
+        enhanced_scraper.data_manager.find_latest_scrape_file = lambda *args, **kwargs: FAKE_CACHE_PATH
+        enhanced_scraper.data_manager.load_scrape_data = lambda *args, **kwargs: sample_scrape_data
         
-        with patch('os.path.getctime', return_value=recent_time):
-            enhanced_scraper.data_manager.find_latest_scrape_file.return_value = str(cached_file)
-            enhanced_scraper.data_manager.load_scrape_data.return_value = sample_scrape_data
-            
-            result = enhanced_scraper._try_cached_data_fallback('testuser')
-            
-            assert result is not None
-            assert result['from_cache'] is True
-            assert abs(result['cache_age_hours'] - 2.0) < 0.1  # Allow small floating point variation
-            assert result['username'] == 'testuser'
+        result = enhanced_scraper._try_cached_data_fallback('testuser')
+        
+        # The ctime was fixed at import, so measure the expected age from it
+        expected_age_hours = (time.time() - _RECENT_CTIME) / 3600
+        assert result is not None
+        assert result['from_cache'] is True
+        assert abs(result['cache_age_hours'] - expected_age_hours) < 0.1  # Allow small floating point variation
+        assert result['username'] == 'testuser'
 
 
 class TestScrapeWithRetry:
@@ -245,56 +273,51 @@ class TestScrapeWithRetry:
     
     def test_primary_fails_cached_data_succeeds(self, enhanced_scraper, sample_scrape_data):
         """Test cached data fallback when primary fails."""
-        with patch.object(enhanced_scraper, '_scrape_primary_method') as mock_primary:
-            with patch.object(enhanced_scraper, '_try_cached_data_fallback') as mock_cached:
-                # Primary fails, cached data succeeds
-                mock_primary.side_effect = ScrapingError("Primary failed")
-                cached_data = sample_scrape_data.copy()
-                cached_data['from_cache'] = True
-                mock_cached.return_value = cached_data
-                
-                result = enhanced_scraper.scrape_with_retry('testuser')
-                
-                assert result['from_cache'] is True
-                mock_cached.assert_called_once_with('testuser')
+        with patch.multiple(enhanced_scraper,
+                            _scrape_primary_method=DEFAULT,
+                            _try_cached_data_fallback=DEFAULT) as mocks:
+            # Primary fails, cached data succeeds
+            mocks['_scrape_primary_method'].side_effect = ScrapingError("Primary failed")
+            cached_data = sample_scrape_data.copy()
+            cached_data['from_cache'] = True
+            mocks['_try_cached_data_fallback'].return_value = cached_data
+            
+            result = enhanced_scraper.scrape_with_retry('testuser')
+            
+            assert result['from_cache'] is True
+            mocks['_try_cached_data_fallback'].assert_called_once_with('testuser')
     
 
 class TestFailureHandling:
     """Test failure handling and notifications."""
     
-    def test_persistent_failure_notification(self, enhanced_scraper):
+    def test_persistent_failure_notification(self, enhanced_scraper, mock_notifier, canned_retry_stats):
         """Test notification sending for persistent failures."""
-        # Ensure notifier is available and failure notifications are enabled
-        enhanced_scraper.notifier = Mock()
+        # The shared module notifier is attached and reset between tests
         enhanced_scraper.degradation_mode.send_failure_notifications = True
         
         # Mock the retry statistics to avoid the key error
-        mock_stats = {
-            'total_attempts': 5,
-            'error_types': {'network': 3, 'timeout': 2},
-            'circuit_breaker': {'state': 'open'}
-        }
-        with patch.object(enhanced_scraper.retry_handler, 'get_retry_statistics', return_value=mock_stats):
+        with patch.object(enhanced_scraper.retry_handler, 'get_retry_statistics', return_value=canned_retry_stats):
             enhanced_scraper._handle_persistent_failure('testuser')
         
-        enhanced_scraper.notifier.send_notification.assert_called_once()
-        call_args = enhanced_scraper.notifier.send_notification.call_args
+        mock_notifier.send_notification.assert_called_once()
+        call_args = mock_notifier.send_notification.call_args
         
         assert 'Persistent scraping failure' in call_args.kwargs['message']
         assert call_args.kwargs['title'] == 'Scraping System Alert'
         assert call_args.kwargs['priority'] == 1
     
-    def test_notification_disabled(self, enhanced_scraper):
+    def test_notification_disabled(self, enhanced_scraper, mock_notifier):
         """Test when failure notifications are disabled."""
         enhanced_scraper.degradation_mode.send_failure_notifications = False
         
-        with patch.object(enhanced_scraper.notifier, 'send_notification') as mock_send:
-            enhanced_scraper._handle_persistent_failure('testuser')
-            
-            mock_send.assert_not_called()
+        enhanced_scraper._handle_persistent_failure('testuser')
+        
+        mock_notifier.send_notification.assert_not_called()
     
     def test_no_notifier_available(self, mock_data_manager):
         """Test handling when no notifier is available."""
+        # Patches its own notifier so the shared module-scoped scraper is untouched
         with patch('src.scrapers.enhanced_scraper.PushoverNotifier', side_effect=Exception("No notifier")):
             scraper = EnhancedScraper()
             assert scraper.notifier is None
@@ -340,8 +363,6 @@ class TestIntegration:
     
     def test_convenience_function(self, sample_scrape_data):
         """Test the convenience function for easy integration."""
-        from src.scrapers.enhanced_scraper import scrape_duome_enhanced
-        
         with patch('src.scrapers.enhanced_scraper.EnhancedScraper') as MockScraper:
             mock_scraper = Mock()
             MockScraper.return_value = mock_scraper
@@ -354,27 +375,31 @@ class TestIntegration:
     
     def test_fallback_retry_logic(self, enhanced_scraper, sample_scrape_data):
         """Test retry logic with fallback method."""
-        call_count = {'primary': 0, 'fallback': 0}
+        primary_calls = 0
+        fallback_calls = 0
         
         def failing_primary_method(username):
-            call_count['primary'] += 1
+            nonlocal primary_calls
+            primary_calls += 1
             # Primary always fails so fallback is triggered
-            raise ScrapingError(f"Primary attempt {call_count['primary']} failed")
+            raise ScrapingError(f"Primary attempt {primary_calls} failed")
         
         def flaky_fallback_method(username):
-            call_count['fallback'] += 1
-            if call_count['fallback'] <= 1:
-                raise ScrapingError(f"Fallback attempt {call_count['fallback']} failed")
+            nonlocal fallback_calls
+            fallback_calls += 1
+            if fallback_calls <= 1:
+                raise ScrapingError(f"Fallback attempt {fallback_calls} failed")
             return sample_scrape_data
         
-        with patch.object(enhanced_scraper, '_scrape_primary_method', failing_primary_method):
-            with patch.object(enhanced_scraper, '_scrape_fallback_method', flaky_fallback_method):
-                result = enhanced_scraper.scrape_with_retry('testuser')
-                
-                assert result == sample_scrape_data
-                # Should have tried primary method (which always fails), then fallback succeeds
-                assert call_count['primary'] >= 1  # Primary was tried
-                assert call_count['fallback'] >= 2  # Fallback succeeded on second attempt
+        with swap_methods(enhanced_scraper,
+                          _scrape_primary_method=failing_primary_method,
+                          _scrape_fallback_method=flaky_fallback_method):
+            result = enhanced_scraper.scrape_with_retry('testuser')
+            
+            assert result == sample_scrape_data
+            # Should have tried primary method (which always fails), then fallback succeeds
+            assert primary_calls >= 1  # Primary was tried
+            assert fallback_calls >= 2  # Fallback succeeded on second attempt
 
 
 if __name__ == "__main__":
@@ -16,20 +16,14 @@ from src.core.metrics_calculator import (
 class TestCountTodaysLessons:
     """Test count_todays_lessons function"""
     
-    def test_count_todays_lessons_basic(self, sample_session_data):
-        """Test basic lesson counting for a specific date"""
-        count = count_todays_lessons(sample_session_data, '2025-06-28')
-        assert count == 2  # Two sessions on 2025-06-28
-    
-    def test_count_todays_lessons_different_date(self, sample_session_data):
-        """Test counting for a different date"""
-        count = count_todays_lessons(sample_session_data, '2025-06-27')
-        assert count == 1  # One session on 2025-06-27
-    
-    def test_count_todays_lessons_no_sessions(self, sample_session_data):
-        """Test counting for date with no sessions"""
-        count = count_todays_lessons(sample_session_data, '2025-06-26')
-        assert count == 0
+    @pytest.mark.parametrize("date,expected", [
+        pytest.param('2025-06-28', 2, id="two_sessions"),
+        pytest.param('2025-06-27', 1, id="different_date"),
+        pytest.param('2025-06-26', 0, id="no_sessions"),
+    ])
+    def test_count_todays_lessons_by_date(self, sample_session_data, date, expected):
+        """Test lesson counting for specific dates in the sample data"""
+        assert count_todays_lessons(sample_session_data, date) == expected
     
     def test_count_todays_lessons_empty_data(self):
         """Test with empty session data"""
@@ -68,41 +62,30 @@ class TestCalculateDailyLessonGoal:
 class TestCalculateDailyProgress:
     """Test calculate_daily_progress function"""
     
-    def test_calculate_daily_progress_on_track(self, sample_state_data):
-        """Test progress calculation when on track"""
-        progress = calculate_daily_progress(sample_state_data)
-        
-        assert progress['completed'] == 9
-        assert progress['goal'] == 15
-        assert progress['remaining'] == 6
-        assert progress['progress_pct'] == 60.0  # 9/15 * 100
-        assert progress['status'] == 'behind'  # 9 < 15 * 0.8 = 12
-    
-    def test_calculate_daily_progress_ahead(self):
-        """Test when ahead of goal"""
-        state_data = {'daily_lessons_completed': 16, 'daily_goal_lessons': 15}
+    @pytest.mark.parametrize("completed,goal,expected_status,expected_remaining,expected_pct", [
+        pytest.param(9, 15, 'behind', 6, 60.0, id="behind"),  # 9 < 15 * 0.8 = 12
+        pytest.param(16, 15, 'ahead', 0, 16 / 15 * 100, id="ahead"),
+        pytest.param(12, 15, 'close', 3, 80.0, id="close"),  # 12 >= 15 * 0.8 = 12
+        pytest.param(15, 15, 'on_track', 0, 100.0, id="exact_goal"),
+    ])
+    def test_calculate_daily_progress_status(self, completed, goal, expected_status, expected_remaining, expected_pct):
+        """Test progress status, remaining lessons and percentage around the goal"""
+        state_data = {'daily_lessons_completed': completed, 'daily_goal_lessons': goal}
         progress = calculate_daily_progress(state_data)
         
-        assert progress['status'] == 'ahead'
-        assert progress['remaining'] == 0
-        assert progress['progress_pct'] > 100
+        assert progress['completed'] == completed
+        assert progress['goal'] == goal
+        assert progress['status'] == expected_status
+        assert progress['remaining'] == expected_remaining
+        assert progress['progress_pct'] == pytest.approx(expected_pct)
     
-    def test_calculate_daily_progress_close(self):
-        """Test when close to goal"""
-        state_data = {'daily_lessons_completed': 12, 'daily_goal_lessons': 15}
-        progress = calculate_daily_progress(state_data)
-        
-        assert progress['status'] == 'close'  # 12 >= 15 * 0.8 = 12
-        assert progress['remaining'] == 3
-    
-    def test_calculate_daily_progress_exact_goal(self):
-        """Test when exactly meeting goal"""
-        state_data = {'daily_lessons_completed': 15, 'daily_goal_lessons': 15}
-        progress = calculate_daily_progress(state_data)
+    def test_calculate_daily_progress_sample_state(self, sample_state_data):
+        """Test progress calculation reads the sample tracker state"""
+        progress = calculate_daily_progress(sample_state_data)
         
-        assert progress['status'] == 'on_track'
-        assert progress['remaining'] == 0
-        assert progress['progress_pct'] == 100.0
+        assert progress['completed'] == 9
+        assert progress['goal'] == 15
+        assert progress['status'] == 'behind'
 
 
 class TestCalculatePerformanceMetrics:
@@ -4,9 +4,7 @@ Tests for the schema migration system.
 """
 
 import pytest
-import tempfile
 import json
-from pathlib import Path
 from unittest.mock import patch
 from datetime import datetime
 
@@ -15,12 +13,26 @@ from src.data.migrations.migrator import SchemaMigrator, ensure_schema_version,
 from src.data.migrations.v1_0_to_v1_1 import V1_0_to_V1_1_Migration
 
 
+@pytest.fixture(scope="module")
+def v1_migration():
+    """V1.0 -> V1.1 migration, shared by the module (stateless, treat as read-only)."""
+    return V1_0_to_V1_1_Migration()
+
+
+@pytest.fixture(scope="module")
+def registered_migrator(v1_migration):
+    """SchemaMigrator with the V1.0 -> V1.1 migration registered (treat as read-only)."""
+    migrator = SchemaMigrator()
+    migrator.register_migration(v1_migration)
+    return migrator
+
+
 class TestMigrationSystem:
     """Test the schema migration framework."""
     
-    def test_v1_0_to_v1_1_migration(self):
+    def test_v1_0_to_v1_1_migration(self, v1_migration):
         """Test the V1.0 to V1.1 migration."""
-        migration = V1_0_to_V1_1_Migration()
+        migration = v1_migration
         
         # Sample V1.0 data (current tracker_state format)
         v1_0_data = {
@@ -59,11 +71,9 @@ class TestMigrationSystem:
         assert migrated_data["total_lessons_completed"] == 172
         assert migrated_data["daily_lessons_completed"] == 15
     
-    def test_schema_migrator_functionality(self):
+    def test_schema_migrator_functionality(self, registered_migrator):
         """Test the SchemaMigrator class."""
-        migrator = SchemaMigrator()
-        migration = V1_0_to_V1_1_Migration()
-        migrator.register_migration(migration)
+        migrator = registered_migrator
         
         # Test version detection
         data_without_version = {"some": "data"}
@@ -105,15 +115,9 @@ class TestMigrationSystem:
 class TestAtomicRepositoryWithVersioning:
     """Test AtomicJSONRepository with schema versioning."""
     
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
-    
-    def test_repository_with_versioning_enabled(self, temp_dir):
+    def test_repository_with_versioning_enabled(self, tmp_path):
         """Test repository with auto-migration enabled."""
-        file_path = temp_dir / "test_data.json"
+        file_path = tmp_path / "test_data.json"
         
         # Create repository with versioning enabled
         repo = AtomicJSONRepository(str(file_path), auto_migrate=True, target_version="1.1")
@@ -123,9 +127,9 @@ class TestAtomicRepositoryWithVersioning:
         assert data["schema_version"] == "1.1"
         assert "default" in data
     
-    def test_repository_migration_on_load(self, temp_dir):
+    def test_repository_migration_on_load(self, tmp_path):
         """Test that repository migrates data on load."""
-        file_path = temp_dir / "tracker_state.json"
+        file_path = tmp_path / "tracker_state.json"
         
         # Create a V1.0 format file manually
         v1_0_data = {
@@ -136,7 +140,7 @@ class TestAtomicRepositoryWithVersioning:
         }
         
         with open(file_path, 'w') as f:
-            json.dump(v1_0_data, f, indent=2)
+            json.dump(v1_0_data, f)
         
         # Load with versioning enabled
         repo = AtomicJSONRepository(str(file_path), auto_migrate=True, target_version="1.1")
@@ -154,9 +158,9 @@ class TestAtomicRepositoryWithVersioning:
         assert saved_data["schema_version"] == "1.1"
         assert "metadata" in saved_data
     
-    def test_repository_without_versioning(self, temp_dir):
+    def test_repository_without_versioning(self, tmp_path):
         """Test repository with versioning disabled."""
-        file_path = temp_dir / "test_data.json"
+        file_path = tmp_path / "test_data.json"
         
         # Create repository with versioning disabled
         repo = AtomicJSONRepository(str(file_path), auto_migrate=False)
@@ -2,10 +2,14 @@
 """
 Tests for Retry Handler
 Tests intelligent retry logic, exponential backoff, and circuit breaker functionality.
+
+Test doubles are defined at module level and clocks are patched per test, so the
+module is safe to run with pytest -n auto.
 """
 
 import pytest
-import time
+import functools
+import random
 from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 
@@ -15,75 +19,98 @@ from src.scrapers.retry_handler import (
 )
 
 
+# Attempt timestamps only need to be plausible, so one clock read serves the module
+_NOW = datetime.now()
+
+# Retry history for the statistics tests, built once; tests install a copy
+_SAMPLE_HISTORY = (
+    RetryAttempt(1, ErrorType.NETWORK, "Network error", 1.0, _NOW),
+    RetryAttempt(2, ErrorType.NETWORK, "Another network error", 2.0, _NOW),
+    RetryAttempt(1, ErrorType.TIMEOUT, "Timeout error", 1.5, _NOW),
+)
+
+
+# Message-only classification is a pure function of the text, so each message is classified once
+_CLASSIFIER = RetryHandler()
+
+
+@functools.lru_cache(maxsize=None)
+def _classify(message):
+    """Classify a plain Exception carrying message."""
+    return _CLASSIFIER.classify_error(Exception(message))
+
+
+# Stand-ins for the selenium exceptions classify_error recognizes by class name
+class TimeoutException(Exception):
+    pass
+
+
+class NoSuchElementException(Exception):
+    pass
+
+
+class VirtualDatetime(datetime):
+    """datetime whose now() is set by the clock fixture and moved with advance()."""
+    current = None
+    
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+    
+    @classmethod
+    def advance(cls, seconds):
+        cls.current += timedelta(seconds=seconds)
+
+
+def _operation():
+    """Spec for operation mocks: a zero-argument callable."""
+
+
+@pytest.fixture(autouse=True)
+def _reset_retry_handler(request):
+    """Clear history and circuit breaker on the class's shared retry handler."""
+    if 'retry_handler' in request.fixturenames:
+        request.getfixturevalue('retry_handler').reset_history()
+
+
 class TestErrorClassification:
     """Test error classification functionality."""
     
-    @pytest.fixture
-    def retry_handler(self):
-        """Create retry handler for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def retry_handler(cls):
+        """Create one retry handler shared by the class; reset before each test."""
         return RetryHandler()
     
-    def test_network_error_classification(self, retry_handler):
-        """Test classification of network errors."""
-        # Create mock exception types
-        class ConnectionError(Exception):
-            pass
-        
-        class URLError(Exception):
-            pass
-        
-        # Test by exception type
-        error = ConnectionError("Connection failed")
-        assert retry_handler.classify_error(error) == ErrorType.NETWORK
-        
-        # Test by message content
-        error = Exception("URLError: connection failed")
-        assert retry_handler.classify_error(error) == ErrorType.NETWORK
-    
-    def test_timeout_error_classification(self, retry_handler):
-        """Test classification of timeout errors."""
-        class TimeoutException(Exception):
-            pass
-        
-        error = TimeoutException("operation timed out")
-        assert retry_handler.classify_error(error) == ErrorType.TIMEOUT
-    
-    def test_browser_error_classification(self, retry_handler):
-        """Test classification of browser automation errors."""
-        class NoSuchElementException(Exception):
-            pass
-        
-        error = NoSuchElementException("element not found")
-        assert retry_handler.classify_error(error) == ErrorType.BROWSER
-    
-    def test_rate_limit_classification(self, retry_handler):
-        """Test classification of rate limit errors."""
-        error = Exception("429 Too Many Requests")
-        assert retry_handler.classify_error(error) == ErrorType.RATE_LIMIT
-        
-        error = Exception("rate limit exceeded")
-        assert retry_handler.classify_error(error) == ErrorType.RATE_LIMIT
-    
-    def test_server_error_classification(self, retry_handler):
-        """Test classification of server errors."""
-        error = Exception("500 Internal Server Error")
-        assert retry_handler.classify_error(error) == ErrorType.SERVER_ERROR
-        
-        error = Exception("503 Service Unavailable")
-        assert retry_handler.classify_error(error) == ErrorType.SERVER_ERROR
-    
-    def test_unknown_error_classification(self, retry_handler):
-        """Test classification of unknown errors."""
-        error = Exception("Some unknown error")
-        assert retry_handler.classify_error(error) == ErrorType.UNKNOWN
+    @pytest.mark.parametrize("exception,expected", [
+        pytest.param(ConnectionError("Connection failed"), ErrorType.NETWORK, id="network"),
+        pytest.param(TimeoutException("operation timed out"), ErrorType.TIMEOUT, id="timeout"),
+        pytest.param(NoSuchElementException("element not found"), ErrorType.BROWSER, id="browser"),
+    ])
+    def test_classification_by_exception_type(self, retry_handler, exception, expected):
+        """Test classification by exception class name."""
+        assert retry_handler.classify_error(exception) == expected
+    
+    @pytest.mark.parametrize("message,expected", [
+        ("URLError: connection failed", ErrorType.NETWORK),
+        ("429 Too Many Requests", ErrorType.RATE_LIMIT),
+        ("rate limit exceeded", ErrorType.RATE_LIMIT),
+        ("500 Internal Server Error", ErrorType.SERVER_ERROR),
+        ("503 Service Unavailable", ErrorType.SERVER_ERROR),
+        ("Some unknown error", ErrorType.UNKNOWN),
+    ])
+    def test_classification_by_message(self, message, expected):
+        """Test classification by error message content."""
+        assert _classify(message) == expected
 
 
 class TestRetryDelay:
     """Test retry delay calculation."""
     
-    @pytest.fixture
-    def retry_handler(self):
-        """Create retry handler for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def retry_handler(cls):
+        """Create one retry handler shared by the class; reset before each test."""
         config = RetryConfig(
             initial_delay=1.0,
             max_delay=60.0,
@@ -118,7 +145,7 @@ class TestRetryDelay:
         browser_delay = retry_handler.calculate_delay(0, ErrorType.BROWSER)
         assert browser_delay < network_delay
     
-    def test_jitter_randomization(self):
+    def test_jitter_randomization(self, monkeypatch):
         """Test that jitter adds randomization to delays."""
         config = RetryConfig(
             initial_delay=1.0,
@@ -127,17 +154,21 @@ class TestRetryDelay:
         )
         retry_handler = RetryHandler(config)
         
-        # Calculate delays multiple times - should vary due to jitter
+        # Seeded generator keeps the samples deterministic without touching global state
+        rng = random.Random(0)
+        monkeypatch.setattr('src.scrapers.retry_handler.random', rng)
+        
         # For NETWORK errors, the initial delay is actually 2.0, and attempt 1 gives 4.0
-        delays = [retry_handler.calculate_delay(1, ErrorType.NETWORK) for _ in range(10)]
+        first_delay = retry_handler.calculate_delay(1, ErrorType.NETWORK)
+        rng.seed(1)
+        second_delay = retry_handler.calculate_delay(1, ErrorType.NETWORK)
         
-        # Should not all be exactly the same
-        assert len(set(delays)) > 1
+        # Different seeds should give different jitter
+        assert first_delay != second_delay
         
-        # Should all be reasonably close to expected value (4.0 for network errors)
-        # Allow wider range due to jitter (10% of 4.0 = 0.4)
-        for delay in delays:
-            assert 3.0 <= delay <= 5.0
+        # Both should stay within the 10% jitter range around 4.0
+        assert 3.6 <= first_delay <= 4.4
+        assert 3.6 <= second_delay <= 4.4
 
 
 class TestCircuitBreaker:
@@ -152,6 +183,13 @@ class TestCircuitBreaker:
         )
         return CircuitBreaker(config)
     
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Virtual clock for the circuit breaker; advance it instead of sleeping."""
+        monkeypatch.setattr(VirtualDatetime, 'current', datetime(2025, 7, 6, 12, 0, 0))
+        monkeypatch.setattr('src.scrapers.retry_handler.datetime', VirtualDatetime)
+        return VirtualDatetime
+    
     def test_initial_state(self, circuit_breaker):
         """Test circuit breaker initial state."""
         assert circuit_breaker.state == CircuitBreakerState.CLOSED
@@ -178,7 +216,7 @@ class TestCircuitBreaker:
         assert circuit_breaker.state == CircuitBreakerState.OPEN
         assert circuit_breaker.can_execute() is False
     
-    def test_timeout_recovery(self, circuit_breaker):
+    def test_timeout_recovery(self, circuit_breaker, clock):
         """Test circuit breaker recovery after timeout."""
         # Open the circuit
         for i in range(3):
@@ -187,8 +225,8 @@ class TestCircuitBreaker:
         assert circuit_breaker.state == CircuitBreakerState.OPEN
         assert circuit_breaker.can_execute() is False
         
-        # Wait for timeout
-        time.sleep(1.1)
+        # Let the timeout pass
+        clock.advance(1.1)
         
         # Should transition to half-open
         assert circuit_breaker.can_execute() is True
@@ -196,11 +234,10 @@ class TestCircuitBreaker:
     
     def test_half_open_success(self, circuit_breaker):
         """Test successful operation in half-open state."""
-        # Open circuit and wait for timeout
-        for i in range(3):
-            circuit_breaker.record_failure()
-        time.sleep(1.1)
-        circuit_breaker.can_execute()  # Triggers transition to half-open
+        # Start from a tripped circuit already in half-open; the transition
+        # itself is covered by test_timeout_recovery
+        circuit_breaker.failure_count = 3
+        circuit_breaker.state = CircuitBreakerState.HALF_OPEN
         
         # Record success in half-open state
         circuit_breaker.record_success()
@@ -209,11 +246,10 @@ class TestCircuitBreaker:
     
     def test_half_open_failure(self, circuit_breaker):
         """Test failed operation in half-open state."""
-        # Open circuit and wait for timeout
-        for i in range(3):
-            circuit_breaker.record_failure()
-        time.sleep(1.1)
-        circuit_breaker.can_execute()  # Triggers transition to half-open
+        # Start from a tripped circuit already in half-open; the transition
+        # itself is covered by test_timeout_recovery
+        circuit_breaker.failure_count = 3
+        circuit_breaker.state = CircuitBreakerState.HALF_OPEN
         
         # Record failure in half-open state
         circuit_breaker.record_failure()
@@ -234,9 +270,10 @@ class TestCircuitBreaker:
 class TestRetryExecution:
     """Test retry execution logic."""
     
-    @pytest.fixture
-    def retry_handler(self):
-        """Create retry handler for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def retry_handler(cls):
+        """Create one retry handler shared by the class; reset before each test."""
         config = RetryConfig(
             max_attempts=3,
             initial_delay=0.01,  # Very short delays for testing
@@ -247,37 +284,37 @@ class TestRetryExecution:
     
     def test_successful_operation(self, retry_handler):
         """Test operation that succeeds on first try."""
-        mock_operation = Mock(return_value="success")
+        mock_operation = Mock(spec=_operation, return_value="success")
         
         result = retry_handler.execute_with_retry(mock_operation, "test_op")
         
         assert result == "success"
-        assert mock_operation.call_count == 1
+        mock_operation.assert_called_once_with()
         assert len(retry_handler.retry_history) == 0
     
     def test_operation_succeeds_after_retries(self, retry_handler):
         """Test operation that succeeds after some failures."""
-        mock_operation = Mock()
-        mock_operation.side_effect = [
-            Exception("First failure"),
-            Exception("Second failure"),
-            "success"  # Succeeds on third try
-        ]
+        call_count = 0
+        def flaky_operation():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise Exception(f"Failure {call_count}")
+            return "success"  # Succeeds on third try
         
-        result = retry_handler.execute_with_retry(mock_operation, "test_op")
+        result = retry_handler.execute_with_retry(flaky_operation, "test_op")
         
         assert result == "success"
-        assert mock_operation.call_count == 3
+        assert call_count == 3
         assert len(retry_handler.retry_history) == 2  # Two failed attempts recorded
     
     def test_operation_fails_all_retries(self, retry_handler):
         """Test operation that fails all retry attempts."""
-        mock_operation = Mock(side_effect=Exception("Always fails"))
+        mock_operation = Mock(spec=_operation, side_effect=Exception("Always fails"))
         
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match="Always fails"):
             retry_handler.execute_with_retry(mock_operation, "test_op")
         
-        assert "Always fails" in str(exc_info.value)
         assert mock_operation.call_count == 3  # max_attempts
         assert len(retry_handler.retry_history) == 3
     
@@ -287,18 +324,17 @@ class TestRetryExecution:
         for i in range(5):  # Exceed threshold
             retry_handler.circuit_breaker.record_failure()
         
-        mock_operation = Mock(return_value="success")
+        mock_operation = Mock(spec=_operation, return_value="success")
         
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match="Circuit breaker is open"):
             retry_handler.execute_with_retry(mock_operation, "test_op")
         
-        assert "Circuit breaker is open" in str(exc_info.value)
-        assert mock_operation.call_count == 0  # Should not be called
+        mock_operation.assert_not_called()
     
     def test_custom_config_override(self, retry_handler):
         """Test using custom configuration for specific operations."""
         custom_config = RetryConfig(max_attempts=1)  # Only one attempt
-        mock_operation = Mock(side_effect=Exception("Fails"))
+        mock_operation = Mock(spec=_operation, side_effect=Exception("Fails"))
         
         with pytest.raises(Exception):
             retry_handler.execute_with_retry(
@@ -307,9 +343,9 @@ class TestRetryExecution:
                 custom_config=custom_config
             )
         
-        assert mock_operation.call_count == 1  # Only one attempt due to custom config
+        mock_operation.assert_called_once_with()  # Only one attempt due to custom config
     
-    def test_retry_delay_timing(self, retry_handler):
+    def test_retry_delay_timing(self, monkeypatch):
         """Test that retry delays are actually applied."""
         # Use slightly longer delay for this test
         config = RetryConfig(
@@ -319,23 +355,35 @@ class TestRetryExecution:
         )
         handler = RetryHandler(config)
         
-        mock_operation = Mock(side_effect=[Exception("Fail"), "success"])
+        call_count = 0
+        def flaky_operation():
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                raise Exception("Fail")
+            return "success"
+        
+        # Record requested sleeps instead of waiting them out
+        sleeps = []
+        monkeypatch.setattr('src.scrapers.retry_handler.time.sleep', sleeps.append)
         
-        start_time = time.time()
-        result = handler.execute_with_retry(mock_operation, "test_op")
-        end_time = time.time()
+        result = handler.execute_with_retry(flaky_operation, "test_op")
         
         assert result == "success"
-        # Should have taken at least the delay time
-        assert end_time - start_time >= 0.1
+        # Should have waited the configured delay once before the retry
+        assert sleeps == [0.1]
+        # ...and recorded that same delay on the failed attempt
+        assert len(handler.retry_history) == 1
+        assert handler.retry_history[0].delay == 0.1
 
 
 class TestRetryStatistics:
     """Test retry statistics and monitoring."""
     
-    @pytest.fixture
-    def retry_handler(self):
-        """Create retry handler for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def retry_handler(cls):
+        """Create one retry handler shared by the class; reset before each test."""
         return RetryHandler()
     
     def test_empty_statistics(self, retry_handler):
@@ -349,11 +397,7 @@ class TestRetryStatistics:
     def test_retry_statistics_collection(self, retry_handler):
         """Test collection of retry statistics."""
         # Manually add some retry attempts
-        retry_handler.retry_history = [
-            RetryAttempt(1, ErrorType.NETWORK, "Network error", 1.0, datetime.now()),
-            RetryAttempt(2, ErrorType.NETWORK, "Another network error", 2.0, datetime.now()),
-            RetryAttempt(1, ErrorType.TIMEOUT, "Timeout error", 1.5, datetime.now()),
-        ]
+        retry_handler.retry_history = list(_SAMPLE_HISTORY)
         
         stats = retry_handler.get_retry_statistics()
         
@@ -368,7 +412,7 @@ class TestRetryStatistics:
         """Test resetting retry history."""
         # Add some history
         retry_handler.retry_history = [
-            RetryAttempt(1, ErrorType.NETWORK, "Error", 1.0, datetime.now())
+            RetryAttempt(1, ErrorType.NETWORK, "Error", 1.0, _NOW)
         ]
         retry_handler.circuit_breaker.record_failure()
         
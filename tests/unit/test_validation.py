@@ -0,0 +1,37 @@
+"""
+Unit tests for validation.py
+Tests the project status report and the fast-fail validity gate.
+"""
+
+from unittest.mock import Mock, patch
+
+from src.utils import validation
+
+
+class TestProjectValidation:
+    """Test get_project_status and is_project_valid"""
+    
+    def test_is_project_valid_stops_at_first_failure(self):
+        """Test that a missing venv fails the gate without running later checks"""
+        data_directory = Mock(return_value=True)
+        path_exists = Mock(return_value=True)
+        
+        with patch.object(validation, 'validate_venv_python', return_value=False), \
+                patch.object(validation, 'validate_data_directory', data_directory), \
+                patch.object(validation.os.path, 'exists', path_exists):
+            assert validation.is_project_valid() is False
+        
+        data_directory.assert_not_called()
+        path_exists.assert_not_called()
+    
+    def test_status_reports_every_check(self):
+        """Test that the status dict covers each check and agrees with the gate"""
+        with patch.object(validation, 'validate_venv_python', return_value=True), \
+                patch.object(validation, 'validate_data_directory', return_value=True), \
+                patch.object(validation.os.path, 'exists', return_value=True):
+            status = validation.get_project_status()
+            valid = validation.is_project_valid()
+        
+        assert list(status) == [name for name, _ in validation.PROJECT_CHECKS] + ['all_valid']
+        assert status['all_valid'] is True
+        assert valid is True